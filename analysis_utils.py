@@ -0,0 +1,25 @@
+"""
+Analysis Utilities Module
+Helpers for reading backtrader analyzer results, shared by the analytics and reporting layers
+"""
+from typing import Any, Dict
+
+
+def freeze_analysis(analysis: Any) -> Any:
+    """Copy a backtrader AutoOrderedDict tree into plain dicts
+
+    Lookups on the copy cannot auto-create (and so mutate) analyzer entries.
+    """
+    if isinstance(analysis, dict):
+        return {key: freeze_analysis(value) for key, value in analysis.items()}
+    return analysis
+
+
+def dig_analysis(analysis: Dict, path: tuple, default: Any = 0) -> Any:
+    """Resolve a nested key path in an analyzer dict, returning default if any level is missing"""
+    cur = analysis
+    for key in path:
+        cur = cur.get(key) if isinstance(cur, dict) else None
+        if cur is None:
+            return default
+    return cur
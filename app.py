@@ -948,7 +948,7 @@ if st.session_state.backtest_results:
                 'basic_report': report,
                 'performance_analysis': performance_analysis,
                 'benchmark_analysis': benchmark_report,
-                'signals_summary': results_data['signals']
+                'signals_summary': SignalExtractor.signals_to_dict(results_data['signals'])
             }
             enhanced_json = json.dumps(enhanced_report, indent=4, default=str)
             st.download_button(
@@ -968,7 +968,7 @@ if st.session_state.backtest_results:
                 st.json(benchmark_report)
 
         with st.expander("🎯 Trading Signals"):
-            st.json(results_data['signals'])
+            st.json(SignalExtractor.signals_to_dict(results_data['signals']))
 
         with st.expander("📋 Complete Report Data"):
             st.json(report)
@@ -2,14 +2,33 @@
 Base Strategy Module
 Contains the base class for all trading strategies with signal logging
 """
+import array
 import backtrader as bt
+import numpy as np
+import pandas as pd
 from abc import abstractmethod
-from typing import Dict, Any
-from signal_extractor import StrategySignalLogger
+from typing import Dict, Any, List, Optional, Tuple
+from signal_extractor import StrategySignalLogger, bt_nums_to_datetimes
+
+
+EXECUTION_DTYPE = np.dtype([
+    ('side', 'i1'),  # 1 buy, -1 sell
+    ('price', 'f8'),
+    ('size', 'f8'),
+    ('value', 'f8'),
+    ('commission', 'f8'),
+    ('datetime', 'datetime64[ns]'),
+])
 
 
 class BaseStrategy(bt.Strategy, StrategySignalLogger):
-    """Base class for all trading strategies with signal logging"""
+    """Base class for all trading strategies with signal logging
+
+    Buy entries take their size from cerebro's sizer. When cerebro has no
+    sizer registered at all, start() installs PercentSizer(95) (95% of
+    available cash) instead of backtrader's implicit FixedSize(1); a sizer
+    added with addsizer/addsizer_byidx, FixedSize included, is kept.
+    """
     
     params = (
         ('printlog', True),
@@ -17,9 +36,23 @@ class BaseStrategy(bt.Strategy, StrategySignalLogger):
     
     def __init__(self):
         bt.Strategy.__init__(self)
-        StrategySignalLogger.__init__(self)
+        # Optimization sweeps only keep analyzer results, so skip the
+        # per-signal and per-fill logs there
+        StrategySignalLogger.__init__(self, enabled=not getattr(self.env, '_dooptimize', False))
         self.order = None
-        self._execution_log = []  # Log execution prices
+        # Columnar execution log: fill prices per side, plus per-fill metadata
+        # columns in fill order (see _execution_log)
+        self._buy_px = array.array('d')
+        self._sell_px = array.array('d')
+        self._exec_side = array.array('b')  # 1 buy, -1 sell
+        self._exec_size = array.array('d')
+        self._exec_value = array.array('d')
+        self._exec_comm = array.array('d')
+        self._exec_dt = array.array('d')  # backtrader date numbers
+        # Full-series signal masks, resolved on the first bar (see _resolve_signal_masks)
+        self._buy_mask = None
+        self._sell_mask = None
+        self._masks_resolved = False
         self._initialize_indicators()
     
     @abstractmethod
@@ -47,11 +80,201 @@ class BaseStrategy(bt.Strategy, StrategySignalLogger):
         """Get reason for sell signal"""
         pass
     
-    def log(self, txt: str, dt=None):
-        """Logging function"""
-        if self.params.printlog:
-            dt = dt or self.datas[0].datetime.date(0)
-            print(f'{dt.isoformat()}: {txt}')
+    def _precompute_signals(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Return (buy, sell) boolean masks over the whole series, or None
+        
+        Override alongside should_buy/should_sell to evaluate the signal rules
+        once over the indicator buffers instead of bar by bar.
+        """
+        return None
+    
+    @classmethod
+    def _vectorized_signals(cls, prices: Dict[str, np.ndarray],
+                            params: Dict[str, Any]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Return (buy, sell) masks computed straight from the price arrays, or None
+        
+        prices maps 'open', 'high', 'low' and 'close' to float64 arrays. Override
+        with the vectorized_signals equivalent of should_buy/should_sell to make
+        the strategy usable with run_vectorized.
+        """
+        return None
+    
+    @classmethod
+    def run_vectorized(cls, df: pd.DataFrame, cash: float = 10000.0, commission: float = 0.0,
+                       **params) -> Optional[Dict[str, Any]]:
+        """Backtest the strategy rules on an OHLC DataFrame without backtrader
+        
+        Mirrors a cerebro run with PercentSizer(95) and a percentage commission:
+        orders fill at the next bar's open, and a buy whose cost exceeds the
+        cash at fill time is rejected. Returns the final portfolio value, the
+        closed trades, every fill, the bars that raised buy/sell orders and the
+        signal log (StrategySignalLogger format, one entry per order), or None
+        if the strategy has no vectorized rules.
+        """
+        values = dict(cls.params._getitems())
+        values.update(params)
+        prices = {name: df[name.capitalize()].to_numpy(dtype=np.float64)
+                  for name in ('open', 'high', 'low', 'close')}
+        result = cls._vectorized_replay(df.index, prices, cash, commission, values)
+        if result is None:
+            return None
+        
+        # The replay reports orders as (bar, +1 buy / -1 sell, reason code) rows
+        orders = result.pop('orders')
+        reason_labels = result.pop('reason_labels')
+        logger = StrategySignalLogger()
+        if orders:
+            bars, sides, codes = (np.asarray(column) for column in zip(*orders))
+            logger.log_signals_bulk(df.index[bars], sides, prices['close'][bars], codes, reason_labels)
+        result['signals'] = logger.get_signals()
+        return result
+    
+    @classmethod
+    def _vectorized_replay(cls, index: pd.Index, prices: Dict[str, np.ndarray], cash: float,
+                           commission: float, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Replay next() over precomputed signal masks (see run_vectorized)
+        
+        Signals come from one full-array pass (_vectorized_signals); only the
+        bars that carry a signal are visited. As in next(), a flat strategy
+        buys with 95% of cash and an invested one sells the whole position.
+        Strategies with their own next() override this instead; besides the
+        run_vectorized keys, overrides return 'orders' as (bar, side, reason
+        code) rows and the 'reason_labels' those codes index into.
+        """
+        masks = cls._vectorized_signals(prices, params)
+        if masks is None:
+            return None
+        buy_mask, sell_mask = masks
+        close, opens = prices['close'], prices['open']
+        
+        n = len(close)
+        size = 0.0
+        entry = None
+        trades = []
+        fills = []
+        orders = []
+        for i in np.flatnonzero(buy_mask | sell_mask):
+            fill = i + 1
+            if not size:
+                if not buy_mask[i]:
+                    continue
+                orders.append((i, 1, 0))
+                if fill >= n:
+                    break  # orders created on the last bar never fill
+                # PercentSizer: cash / close * percents / 100
+                order_size = cash / close[i] * 0.95
+                cost = order_size * opens[fill]
+                if cost * (1 + commission) > cash:
+                    continue  # rejected for insufficient cash, as the broker would
+                cash -= cost * (1 + commission)
+                size = order_size
+                entry = (fill, opens[fill], cost * commission)
+                fills.append({'side': 'buy', 'time': index[fill], 'price': opens[fill], 'size': size})
+            elif sell_mask[i]:
+                orders.append((i, -1, 1))
+                if fill >= n:
+                    break
+                proceeds = size * opens[fill]
+                cash += proceeds * (1 - commission)
+                entry_index, entry_price, entry_comm = entry
+                trades.append({
+                    'entry_time': index[entry_index],
+                    'entry_price': entry_price,
+                    'exit_time': index[fill],
+                    'exit_price': opens[fill],
+                    'size': size,
+                    'pnl': size * (opens[fill] - entry_price) - entry_comm - proceeds * commission
+                })
+                fills.append({'side': 'sell', 'time': index[fill], 'price': opens[fill], 'size': -size})
+                size = 0.0
+        
+        return {
+            'final_value': cash + size * close[-1] if n else cash,
+            'trades': trades,
+            'fills': fills,
+            'buy_signals': buy_mask,
+            'sell_signals': sell_mask,
+            'orders': orders,
+            'reason_labels': ('Buy signal', 'Sell signal')
+        }
+    
+    def _resolve_signal_masks(self):
+        """Build the precomputed signal masks if the run allows it"""
+        self._masks_resolved = True
+        
+        # Indicator buffers only cover the whole series when cerebro preloads
+        # the data and computes indicators in runonce (vectorized) mode
+        if not (getattr(self.env, '_dopreload', False) and getattr(self.env, '_dorunonce', False)):
+            return
+        
+        masks = self._precompute_signals()
+        if masks is None:
+            return
+        
+        buy_mask, sell_mask = masks
+        n = len(self.data.close.array)
+        if len(buy_mask) == n and len(sell_mask) == n:
+            self._buy_mask, self._sell_mask = buy_mask, sell_mask
+    
+    def _buy_signal(self) -> bool:
+        """Buy condition for the current bar, from the precomputed mask when available"""
+        if self._buy_mask is not None:
+            return self._buy_mask[len(self) - 1]
+        return self.should_buy()
+    
+    def _sell_signal(self) -> bool:
+        """Sell condition for the current bar, from the precomputed mask when available"""
+        if self._sell_mask is not None:
+            return self._sell_mask[len(self) - 1]
+        return self.should_sell()
+    
+    @property
+    def execution_log(self) -> np.ndarray:
+        """Fills in order as a structured array (see EXECUTION_DTYPE)
+        
+        Assembled column by column from the array buffers, so the log itself
+        stays append-only and cheap to grow during the run.
+        """
+        side = np.frombuffer(self._exec_side, dtype=np.int8)
+        records = np.empty(len(side), dtype=EXECUTION_DTYPE)
+        records['side'] = side
+        records['price'][side > 0] = np.frombuffer(self._buy_px, dtype=np.float64)
+        records['price'][side < 0] = np.frombuffer(self._sell_px, dtype=np.float64)
+        records['size'] = np.frombuffer(self._exec_size, dtype=np.float64)
+        records['value'] = np.frombuffer(self._exec_value, dtype=np.float64)
+        records['commission'] = np.frombuffer(self._exec_comm, dtype=np.float64)
+        records['datetime'] = bt_nums_to_datetimes(self._exec_dt).values
+        return records
+    
+    @property
+    def _execution_log(self) -> List[Dict[str, Any]]:
+        """Execution records as dicts, rebuilt on demand from the columnar log"""
+        buy_px, sell_px = iter(self._buy_px), iter(self._sell_px)
+        return [
+            {
+                'side': 'buy' if side > 0 else 'sell',
+                'price': next(buy_px) if side > 0 else next(sell_px),
+                'size': size,
+                'value': value,
+                'commission': comm,
+                'datetime': bt.num2date(dt)
+            }
+            for side, size, value, comm, dt in zip(self._exec_side, self._exec_size,
+                                                   self._exec_value, self._exec_comm, self._exec_dt)
+        ]
+    
+    def log(self, txt: str, *args, dt=None):
+        """Logging function
+        
+        Positional args are applied to txt with str.format only when printlog
+        is on, so callers can pass a template and skip formatting otherwise.
+        """
+        if not self.params.printlog:
+            return
+        if args:
+            txt = txt.format(*args)
+        dt = dt or self.datas[0].datetime.date(0)
+        print(f'{dt.isoformat()}: {txt}')
     
     def notify_order(self, order):
         """Handle order notifications"""
@@ -60,29 +283,23 @@ class BaseStrategy(bt.Strategy, StrategySignalLogger):
 
         if order.status in [order.Completed]:
             # Log execution for extraction later
-            execution_record = {
-                'side': 'buy' if order.isbuy() else 'sell',
-                'price': order.executed.price,
-                'size': order.executed.size,
-                'value': order.executed.value,
-                'commission': order.executed.comm,
-                'datetime': self.datas[0].datetime.datetime(0)
-            }
-            self._execution_log.append(execution_record)
+            is_buy = order.isbuy()
+            if self._signals_enabled:
+                (self._buy_px if is_buy else self._sell_px).append(order.executed.price)
+                self._exec_side.append(1 if is_buy else -1)
+                self._exec_size.append(order.executed.size)
+                self._exec_value.append(order.executed.value)
+                self._exec_comm.append(order.executed.comm)
+                self._exec_dt.append(self.datas[0].datetime[0])
             
-            if order.isbuy():
-                self.log(f'BUY EXECUTED: Price: {order.executed.price:.2f}, '
-                        f'Size: {order.executed.size:.6f}, '
-                        f'Cost: {order.executed.value:.2f}, '
-                        f'Comm: {order.executed.comm:.2f}')
-            else:
-                self.log(f'SELL EXECUTED: Price: {order.executed.price:.2f}, '
-                        f'Size: {order.executed.size:.6f}, '
-                        f'Cost: {order.executed.value:.2f}, '
-                        f'Comm: {order.executed.comm:.2f}')
+            if self.params.printlog:
+                self.log('{} EXECUTED: Price: {:.2f}, Size: {:.6f}, Cost: {:.2f}, Comm: {:.2f}',
+                         'BUY' if is_buy else 'SELL', order.executed.price, order.executed.size,
+                         order.executed.value, order.executed.comm)
 
         elif order.status in [order.Canceled, order.Margin, order.Rejected]:
-            self.log(f'Order Canceled/Margin/Rejected - Status: {order.getstatusname()}')
+            if self.params.printlog:
+                self.log('Order Canceled/Margin/Rejected - Status: {}', order.getstatusname())
 
         self.order = None
     
@@ -92,33 +309,43 @@ class BaseStrategy(bt.Strategy, StrategySignalLogger):
         if self.order:
             return
 
-        # Check if we are in the market
-        if not self.position:
+        if not self._masks_resolved:
+            self._resolve_signal_masks()
+
+        # Check if we are in the market (position size read once per bar)
+        pos_size = self.position.size
+        if pos_size == 0:
             # Not in market, check if we should buy
-            if self.should_buy():
-                # Calculate position size (use 95% of available cash)
-                cash = self.broker.getcash()
+            if self._buy_signal():
                 price = self.data.close[0]
-                size = (cash * 0.95) / price
 
-                # Log the buy signal
-                reason = self.get_buy_reason()
-                self.log_buy_signal(price, reason)
+                # Log the buy signal (the reason is only built if it will be kept)
+                if self._signals_enabled:
+                    self.log_buy_signal(price, self.get_buy_reason())
                 
-                self.log(f'BUY CREATE: Price: {price:.2f}, Size: {size:.6f}, Cash: {cash:.2f}')
-                self.order = self.buy(size=size)
+                if self.params.printlog:
+                    self.log('BUY CREATE: Price: {:.2f}, Size: {:.6f}, Cash: {:.2f}',
+                             price, self.getsizing(), self.broker.getcash())
+                # Position size comes from the sizer (PercentSizer(95) unless cerebro sets one, see start)
+                self.order = self.buy()
         else:
             # In market, check if we should sell
-            if self.should_sell():
+            if self._sell_signal():
                 price = self.data.close[0]
                 
-                # Log the sell signal
-                reason = self.get_sell_reason()
-                self.log_sell_signal(price, reason)
+                # Log the sell signal (the reason is only built if it will be kept)
+                if self._signals_enabled:
+                    self.log_sell_signal(price, self.get_sell_reason())
                 
-                self.log(f'SELL CREATE: Price: {price:.2f}')
-                self.order = self.sell(size=self.position.size)
+                self.log('SELL CREATE: Price: {:.2f}', price)
+                self.order = self.sell(size=pos_size)
+    
+    def start(self):
+        """Called before the first bar"""
+        # No sizer on cerebro means backtrader's implicit FixedSize(1)
+        if not self.env.sizers:
+            self.setsizer(bt.sizers.PercentSizer(percents=95))
     
     def stop(self):
         """Called when strategy ends"""
-        self.log(f'Strategy ended with portfolio value: {self.broker.getvalue():.2f}')
\ No newline at end of file
+        self.log('Strategy ended with portfolio value: {:.2f}', self.broker.getvalue())
\ No newline at end of file
@@ -4,8 +4,12 @@ This strategy buys BTC when price dips or shows upward momentum and
 takes profit dynamically based on volatility.
 """
 import backtrader as bt
+import numpy as np
 from base_strategy import BaseStrategy
 
+# Columns of the open-lot array
+_ENTRY, _SIZE, _TARGET_PCT, _TARGET, _STOP = range(5)
+
 
 class BTCTraderStrategy(BaseStrategy):
     """BTC trading strategy with dynamic profit targets and stop losses."""
@@ -25,7 +29,10 @@ class BTCTraderStrategy(BaseStrategy):
         self.low24 = bt.indicators.Lowest(self.data.low, period=24)
         self.avg24 = bt.indicators.SimpleMovingAverage(self.data.close, period=24)
         self.momentum = bt.indicators.Momentum(self.data.close, period=self.params.momentum_period)
-        self.lots = []
+        # Open lots, one row each (see the column constants); the first
+        # _nlots rows are live, in the order they were bought
+        self._lots = np.empty((64, 5))
+        self._nlots = 0
         self.allocated = 0.0
         self._sell_reason = ""
         self._lot_to_sell = None
@@ -45,23 +52,28 @@ class BTCTraderStrategy(BaseStrategy):
 
     def should_sell(self) -> bool:
         """Check all open lots for sell signals."""
+        if not self._nlots:
+            return False
         price = self.data.close[0]
-        for lot in self.lots:
-            target = lot['entry'] * (1 + lot['target_pct'] / 100)
-            stop = lot['entry'] * 0.995
-            if price >= target:
-                self._sell_reason = f"Profit target {lot['target_pct']:.2f}%"
-                self._lot_to_sell = lot
-                return True
-            if price <= stop:
-                self._sell_reason = 'Stop loss hit'
-                self._lot_to_sell = lot
-                return True
-            if self.momentum[0] < 0 and price > lot['entry']:
-                self._sell_reason = 'Weak momentum'
-                self._lot_to_sell = lot
-                return True
-        return False
+        lots = self._lots[:self._nlots]
+        hit_target = price >= lots[:, _TARGET]
+        hit_stop = price <= lots[:, _STOP]
+        exits = hit_target | hit_stop
+        if self.momentum[0] < 0:
+            exits |= price > lots[:, _ENTRY]
+
+        # The oldest lot with any exit condition sells first
+        idx = int(exits.argmax())
+        if not exits[idx]:
+            return False
+        if hit_target[idx]:
+            self._sell_reason = f"Profit target {lots[idx, _TARGET_PCT]:.2f}%"
+        elif hit_stop[idx]:
+            self._sell_reason = 'Stop loss hit'
+        else:
+            self._sell_reason = 'Weak momentum'
+        self._lot_to_sell = idx
+        return True
 
     def get_buy_reason(self) -> str:
         """Return reason for the current buy signal."""
@@ -83,12 +95,15 @@ class BTCTraderStrategy(BaseStrategy):
 
         if self.should_sell():
             price = self.data.close[0]
-            lot = self._lot_to_sell
+            idx = self._lot_to_sell
+            entry, size = self._lots[idx, _ENTRY], self._lots[idx, _SIZE]
             self.log_sell_signal(price, self._sell_reason)
-            self.log(f'SELL CREATE: Price: {price:.2f}')
-            self.order = self.sell(size=lot['size'])
-            self.lots.remove(lot)
-            self.allocated -= lot['entry'] * lot['size']
+            self.log('SELL CREATE: Price: {:.2f}', price)
+            self.order = self.sell(size=size)
+            # Close the gap, keeping the remaining lots in purchase order
+            self._lots[idx:self._nlots - 1] = self._lots[idx + 1:self._nlots]
+            self._nlots -= 1
+            self.allocated -= entry * size
             self._lot_to_sell = None
             return
 
@@ -100,15 +115,16 @@ class BTCTraderStrategy(BaseStrategy):
             )
             size = trade_value / price
             target_pct = self._profit_target_pct()
-            reason = self.get_buy_reason()
-            self.log_buy_signal(price, reason)
-            self.log(
-                f'BUY CREATE: Price: {price:.2f}, Value: {trade_value:.2f}'
-            )
+            if self._signals_enabled:
+                self.log_buy_signal(price, self.get_buy_reason())
+            self.log('BUY CREATE: Price: {:.2f}, Value: {:.2f}', price, trade_value)
             self.order = self.buy(size=size)
-            self.lots.append(
-                {'entry': price, 'size': size, 'target_pct': target_pct}
+            if self._nlots == len(self._lots):
+                self._lots = np.concatenate([self._lots, np.empty_like(self._lots)])
+            self._lots[self._nlots] = (
+                price, size, target_pct, price * (1 + target_pct / 100), price * 0.995
             )
+            self._nlots += 1
             self.allocated += trade_value
 
     @classmethod
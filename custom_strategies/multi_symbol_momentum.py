@@ -55,6 +55,12 @@ class MultiSymbolMomentumStrategy(BaseStrategy):
                 "orig_size": 0.0,
             }
 
+    def should_buy(self) -> bool:  # not used but required
+        return False
+
+    def should_sell(self) -> bool:  # not used but required
+        return False
+
     # helper to map data name to config
     def _symbol_config(self, data):
         name = getattr(data, "_name", "") or str(data._dataname)
@@ -104,7 +110,7 @@ class MultiSymbolMomentumStrategy(BaseStrategy):
                 size = trade_value / price
                 self.log_buy_signal(price, reason)
                 self.log(
-                    f"BUY CREATE {data._name}: Price {price:.2f}, Value {trade_value:.2f}"
+                    "BUY CREATE {}: Price {:.2f}, Value {:.2f}", data._name, price, trade_value
                 )
                 self.buy(data=data, size=size)
                 ind["entry_price"] = price
@@ -147,7 +153,7 @@ class MultiSymbolMomentumStrategy(BaseStrategy):
                     sell_reason = "Stop loss"
                 if sell_reason:
                     self.log_sell_signal(price, sell_reason)
-                    self.log(f"SELL CREATE {data._name}: Price {price:.2f}")
+                    self.log("SELL CREATE {}: Price {:.2f}", data._name, price)
                     self.sell(data=data, size=self.getposition(data).size)
                     profit = (price - ind["entry_price"]) * ind["size"]
                     if profit > 0:
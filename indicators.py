@@ -0,0 +1,224 @@
+"""
+Indicators Module
+NumPy-backed drop-in replacements for backtrader's pure-Python indicators
+"""
+import array
+import math
+
+import backtrader as bt
+import numpy as np
+
+from vectorized_signals import bollinger_bands, fib_levels, rsi
+
+
+class FastSMA(bt.Indicator):
+    """Simple Moving Average with a vectorized runonce pass
+
+    Behaves like ``bt.indicators.SimpleMovingAverage`` (same ``sma`` line and
+    minimum period) but fills the whole series in one NumPy pass when cerebro
+    runs in runonce mode instead of summing each window in Python.
+    """
+
+    lines = ('sma',)
+    params = (('period', 30),)
+    plotinfo = dict(subplot=False)
+
+    def __init__(self):
+        self.addminperiod(self.p.period)
+
+    def next(self):
+        """Per-bar fallback used in runnext/live mode"""
+        self.lines.sma[0] = math.fsum(self.data.get(size=self.p.period)) / self.p.period
+
+    def once(self, start, end):
+        """Fill bars [start, end) from sliding windows over the source buffer"""
+        period = self.p.period
+        first = max(start, period - 1)
+        if first >= end:
+            return
+
+        src = np.asarray(self.data.array, dtype=np.float64)[first - period + 1:end]
+        windows = np.lib.stride_tricks.sliding_window_view(src, period)
+        values = windows.sum(axis=1) / period
+
+        _write_back(self.lines.sma, first, end, values)
+
+
+class FastCrossOver(bt.Indicator):
+    """CrossOver (+1 up, -1 down, 0 otherwise) with a vectorized runonce pass
+
+    Follows ``bt.indicators.CrossOver`` semantics: a cross is judged against
+    the last non-zero difference between the two inputs, so touching and
+    then separating again does not register as a cross.
+    """
+
+    lines = ('crossover',)
+    plotinfo = dict(plotymargin=0.05, plotyhlines=[-1.0, 1.0])
+
+    def __init__(self):
+        self.addminperiod(2)
+        self._nzd = None
+
+    def next(self):
+        """Per-bar fallback used in runnext/live mode"""
+        if self._nzd is None:
+            self._nzd = self.data0[-1] - self.data1[-1]
+
+        diff = self.data0[0] - self.data1[0]
+        if self._nzd < 0 and diff > 0:
+            self.lines.crossover[0] = 1.0
+        elif self._nzd > 0 and diff < 0:
+            self.lines.crossover[0] = -1.0
+        else:
+            self.lines.crossover[0] = 0.0
+
+        if diff:
+            self._nzd = diff
+
+    def once(self, start, end):
+        """Fill bars [start, end) from sign changes of the forward-filled difference"""
+        diff = (np.asarray(self.data0.array, dtype=np.float64)[:end]
+                - np.asarray(self.data1.array, dtype=np.float64)[:end])
+        valid = np.flatnonzero(~np.isnan(diff))
+        if len(valid) == 0:
+            return
+
+        # Last non-zero difference, seeded with the first valid difference
+        seg = diff[valid[0]:]
+        keep = seg != 0
+        keep[0] = True
+        nzd = seg[np.maximum.accumulate(np.where(keep, np.arange(len(seg)), 0))]
+
+        prev, cur = nzd[:-1], seg[1:]
+        cross = ((prev < 0) & (cur > 0)).astype(np.float64) - ((prev > 0) & (cur < 0))
+
+        # cross[k] belongs to bar valid[0] + 1 + k
+        first = max(start, valid[0] + 1)
+        if first >= end:
+            return
+        _write_back(self.lines.crossover, first, end, cross[first - valid[0] - 1:])
+
+
+class FastRSI(bt.Indicator):
+    """Relative Strength Index (Wilder smoothing) with a vectorized runonce pass
+
+    Same ``rsi`` line and minimum period as ``bt.indicators.RSI`` with
+    ``safediv=True`` (100 without losses, 50 without any moves); the whole
+    series is computed by ``vectorized_signals.rsi`` in runonce mode.
+    """
+
+    lines = ('rsi',)
+    params = (('period', 14),)
+    plotinfo = dict(plotyhlines=[30.0, 70.0])
+
+    def __init__(self):
+        self.addminperiod(self.p.period + 1)
+        self._avg_up = None
+        self._avg_down = None
+
+    def next(self):
+        """Per-bar fallback used in runnext/live mode"""
+        period = self.p.period
+        if self._avg_up is None:
+            # Seed with the plain average of the first period's moves
+            moves = np.diff(np.asarray(self.data.get(size=period + 1), dtype=np.float64))
+            self._avg_up = float(moves[moves > 0].sum()) / period
+            self._avg_down = float(-moves[moves < 0].sum()) / period
+        else:
+            move = self.data[0] - self.data[-1]
+            self._avg_up += (max(move, 0.0) - self._avg_up) / period
+            self._avg_down += (max(-move, 0.0) - self._avg_down) / period
+
+        if self._avg_down:
+            self.lines.rsi[0] = 100.0 - 100.0 / (1.0 + self._avg_up / self._avg_down)
+        else:
+            # No losses: 100, or neutral 50 without any moves (RSI with safediv=True)
+            self.lines.rsi[0] = 100.0 if self._avg_up else 50.0
+
+    def once(self, start, end):
+        """Fill bars [start, end) from one pass over the source buffer"""
+        first = max(start, self.p.period)
+        if first >= end:
+            return
+        values = rsi(np.asarray(self.data.array, dtype=np.float64)[:end], self.p.period)
+        _write_back(self.lines.rsi, first, end, values[first:])
+
+
+class FastBollingerBands(bt.Indicator):
+    """Bollinger Bands (population standard deviation) with a vectorized runonce pass
+
+    Same ``mid``/``top``/``bot`` lines as ``bt.indicators.BollingerBands``.
+    """
+
+    lines = ('mid', 'top', 'bot')
+    params = (('period', 20), ('devfactor', 2.0))
+    plotinfo = dict(subplot=False)
+
+    def __init__(self):
+        self.addminperiod(self.p.period)
+
+    def next(self):
+        """Per-bar fallback used in runnext/live mode"""
+        window = np.asarray(self.data.get(size=self.p.period), dtype=np.float64)
+        mid = window.mean()
+        band = self.p.devfactor * window.std()
+        self.lines.mid[0] = mid
+        self.lines.top[0] = mid + band
+        self.lines.bot[0] = mid - band
+
+    def once(self, start, end):
+        """Fill bars [start, end) from sliding windows over the source buffer"""
+        period = self.p.period
+        first = max(start, period - 1)
+        if first >= end:
+            return
+        src = np.asarray(self.data.array, dtype=np.float64)[first - period + 1:end]
+        mid, top, bot = bollinger_bands(src, period, self.p.devfactor)
+        _write_back(self.lines.mid, first, end, mid[period - 1:])
+        _write_back(self.lines.top, first, end, top[period - 1:])
+        _write_back(self.lines.bot, first, end, bot[period - 1:])
+
+
+class FibLevels(bt.Indicator):
+    """38.2% and 61.8% retracement levels of the rolling high/low range
+
+    Takes the high series as data0 and the low series as data1. The highest
+    high and lowest low over ``period`` bars and both levels are computed in
+    one pass, instead of Highest/Lowest plus four chained line operations.
+    """
+
+    lines = ('l382', 'l618')
+    params = (('period', 50),)
+    plotinfo = dict(subplot=False)
+
+    def __init__(self):
+        self.addminperiod(self.p.period)
+
+    def next(self):
+        """Per-bar fallback used in runnext/live mode"""
+        high = max(self.data0.get(size=self.p.period))
+        diff = high - min(self.data1.get(size=self.p.period))
+        self.lines.l382[0] = high - diff * 0.382
+        self.lines.l618[0] = high - diff * 0.618
+
+    def once(self, start, end):
+        """Fill bars [start, end) from rolling windows over the high/low buffers"""
+        period = self.p.period
+        first = max(start, period - 1)
+        if first >= end:
+            return
+
+        window = slice(first - period + 1, end)
+        l382, l618 = fib_levels(np.asarray(self.data0.array, dtype=np.float64)[window],
+                                np.asarray(self.data1.array, dtype=np.float64)[window], period)
+        _write_back(self.lines.l382, first, end, l382[period - 1:])
+        _write_back(self.lines.l618, first, end, l618[period - 1:])
+
+
+def _write_back(line, start: int, end: int, values: np.ndarray) -> None:
+    """Store computed values into a line's buffer for bars [start, end)
+
+    Goes through array.array rather than a NumPy view so no buffer export
+    outlives the call and backtrader can keep resizing the line.
+    """
+    line.array[start:end] = array.array('d', np.ascontiguousarray(values, dtype=np.float64).tobytes())
@@ -50,6 +50,8 @@ def run_backtest(config: dict, strategy_class: type, strategy_params: dict = Non
     # Set broker parameters
     cerebro.broker.set_cash(config['initial_capital'])
     cerebro.broker.setcommission(commission=config['commission'])
+    # Size buy entries at 95% of available cash
+    cerebro.addsizer(bt.sizers.PercentSizer, percents=95)
     
     # Add analyzers
     add_analyzers(cerebro)
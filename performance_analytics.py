@@ -6,6 +6,8 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 from scipy import stats
 import backtrader as bt
+from analysis_utils import freeze_analysis
+from signal_extractor import bt_nums_to_datetimes, line_buffer
 
 
 class PerformanceAnalyzer:
@@ -13,6 +15,7 @@ class PerformanceAnalyzer:
     
     def __init__(self):
         self.risk_free_rate = 0.02  # 2% annual risk-free rate
+        self.rolling_window = 30  # bars per rolling-metric window
     
     def analyze_backtest_results(self, cerebro: bt.Cerebro, results: List, 
                                 data: pd.DataFrame) -> Dict:
@@ -26,9 +29,15 @@ class PerformanceAnalyzer:
         # Extract portfolio values over time
         portfolio_values = self._extract_portfolio_values(cerebro)
         
-        # Calculate returns
+        # Calculate returns (NaN-free, so downstream helpers skip their own dropna)
         returns = self._calculate_returns(portfolio_values)
         
+        # Short backtests (common in parameter sweeps) skip rolling metrics up front
+        if len(returns) >= self.rolling_window:
+            rolling_metrics = self._calculate_rolling_metrics(returns, self.rolling_window)
+        else:
+            rolling_metrics = {}
+        
         # Get all analysis components
         analysis = {
             'portfolio_values': portfolio_values,
@@ -38,7 +47,7 @@ class PerformanceAnalyzer:
             'trade_metrics': self._calculate_trade_metrics(strategy),
             'time_analysis': self._calculate_time_analysis(returns),
             'distribution_analysis': self._calculate_distribution_analysis(returns),
-            'rolling_metrics': self._calculate_rolling_metrics(returns),
+            'rolling_metrics': rolling_metrics,
             'monthly_analysis': self._calculate_monthly_analysis(returns),
             'correlations': self._calculate_correlation_analysis(returns, data)
         }
@@ -49,37 +58,36 @@ class PerformanceAnalyzer:
         """Extract portfolio values over time"""
         
         # Get portfolio values from cerebro
-        values = []
-        dates = []
+        values = None
         
         # Try to extract from observers
         if hasattr(cerebro, '_userobs') and cerebro._userobs:
             for observer in cerebro._userobs:
                 if hasattr(observer, 'lines') and hasattr(observer.lines, 'value'):
-                    values = observer.lines.value.array
+                    values = line_buffer(observer.lines.value)
                     break
         
         # Fallback: use broker values if available
-        if not values and hasattr(cerebro, 'broker'):
+        if (values is None or len(values) == 0) and hasattr(cerebro, 'broker'):
             # This is a simplified approach
             initial_value = cerebro.broker.get_cash()
             values = [initial_value]  # Placeholder
         
-        # Create date index (simplified)
-        if hasattr(cerebro, 'datas') and cerebro.datas:
-            data_feed = cerebro.datas[0]
-            for i in range(len(values) if values else 1):
-                try:
-                    dates.append(data_feed.datetime.datetime(i))
-                except:
-                    dates.append(pd.Timestamp.now())
-        
-        if not values:
+        if values is None or len(values) == 0:
             values = [10000]  # Default value
-        if not dates:
-            dates = [pd.Timestamp.now()]
+        values = np.asarray(values, dtype=np.float64)
+        
+        # Create date index straight from the feed's float day numbers
+        index = None
+        if hasattr(cerebro, 'datas') and cerebro.datas:
+            dt_nums = line_buffer(cerebro.datas[0].datetime)[:len(values)]
+            if len(dt_nums) == len(values):
+                index = bt_nums_to_datetimes(dt_nums)
         
-        return pd.Series(values, index=dates[:len(values)])
+        if index is None:
+            index = pd.DatetimeIndex([pd.Timestamp.now()] * len(values))
+        
+        return pd.Series(values, index=index)
     
     def _calculate_returns(self, portfolio_values: pd.Series) -> pd.Series:
         """Calculate portfolio returns"""
@@ -192,45 +200,86 @@ class PerformanceAnalyzer:
             'avg_trade_duration': 0
         }
         
-        # Extract from trade analyzer if available
-        if hasattr(strategy, 'analyzers') and hasattr(strategy.analyzers, 'trades'):
-            trades = strategy.analyzers.trades.get_analysis()
+        # Bail out before any analyzer lookups when no trade analyzer is configured
+        analyzers = getattr(strategy, 'analyzers', None)
+        if analyzers is None or len(analyzers) == 0 or not hasattr(analyzers, 'trades'):
+            wins, losses = self._calculate_streaks(self._closed_trade_pnls(strategy))
+            trade_metrics['max_consecutive_wins'] = wins
+            trade_metrics['max_consecutive_losses'] = losses
+            return trade_metrics
+        
+        trades = freeze_analysis(analyzers.trades.get_analysis())
+        
+        if 'total' in trades:
+            trade_metrics['total_trades'] = trades['total'].get('total', 0)
+            
+            # Winning trades
+            if 'won' in trades:
+                trade_metrics['winning_trades'] = trades['won'].get('total', 0)
+                trade_metrics['avg_win'] = trades['won'].get('pnl', {}).get('average', 0)
+            
+            # Losing trades
+            if 'lost' in trades:
+                trade_metrics['losing_trades'] = trades['lost'].get('total', 0)
+                trade_metrics['avg_loss'] = trades['lost'].get('pnl', {}).get('average', 0)
             
-            if 'total' in trades:
-                trade_metrics['total_trades'] = trades['total'].get('total', 0)
-                
-                # Winning trades
-                if 'won' in trades:
-                    trade_metrics['winning_trades'] = trades['won'].get('total', 0)
-                    trade_metrics['avg_win'] = trades['won'].get('pnl', {}).get('average', 0)
-                
-                # Losing trades
-                if 'lost' in trades:
-                    trade_metrics['losing_trades'] = trades['lost'].get('total', 0)
-                    trade_metrics['avg_loss'] = trades['lost'].get('pnl', {}).get('average', 0)
-                
-                # Calculate win rate
-                if trade_metrics['total_trades'] > 0:
-                    trade_metrics['win_rate'] = (trade_metrics['winning_trades'] / 
-                                               trade_metrics['total_trades']) * 100
-                
-                # Profit factor
-                gross_profit = abs(trade_metrics['avg_win'] * trade_metrics['winning_trades'])
-                gross_loss = abs(trade_metrics['avg_loss'] * trade_metrics['losing_trades'])
-                trade_metrics['profit_factor'] = gross_profit / gross_loss if gross_loss > 0 else 0
-                
-                # Best and worst trades
-                if 'pnl' in trades['total']:
-                    trade_metrics['best_trade'] = trades['total']['pnl'].get('max', 0)
-                    trade_metrics['worst_trade'] = trades['total']['pnl'].get('min', 0)
-                
-                # Consecutive wins/losses
-                if 'streak' in trades:
-                    trade_metrics['max_consecutive_wins'] = trades['streak'].get('won', {}).get('longest', 0)
-                    trade_metrics['max_consecutive_losses'] = trades['streak'].get('lost', {}).get('longest', 0)
+            # Calculate win rate
+            if trade_metrics['total_trades'] > 0:
+                trade_metrics['win_rate'] = (trade_metrics['winning_trades'] / 
+                                           trade_metrics['total_trades']) * 100
+            
+            # Profit factor
+            gross_profit = abs(trade_metrics['avg_win'] * trade_metrics['winning_trades'])
+            gross_loss = abs(trade_metrics['avg_loss'] * trade_metrics['losing_trades'])
+            trade_metrics['profit_factor'] = gross_profit / gross_loss if gross_loss > 0 else 0
+            
+            # Best and worst trades
+            if 'pnl' in trades['total']:
+                trade_metrics['best_trade'] = trades['total']['pnl'].get('max', 0)
+                trade_metrics['worst_trade'] = trades['total']['pnl'].get('min', 0)
+            
+            # Consecutive wins/losses
+            if 'streak' in trades:
+                trade_metrics['max_consecutive_wins'] = trades['streak'].get('won', {}).get('longest', 0)
+                trade_metrics['max_consecutive_losses'] = trades['streak'].get('lost', {}).get('longest', 0)
+            else:
+                wins, losses = self._calculate_streaks(self._closed_trade_pnls(strategy))
+                trade_metrics['max_consecutive_wins'] = wins
+                trade_metrics['max_consecutive_losses'] = losses
         
         return trade_metrics
     
+    def _closed_trade_pnls(self, strategy) -> np.ndarray:
+        """Net P&L of the strategy's closed trades, ordered by close time"""
+        
+        # bt.Strategy keeps trades as {data: {tradeid: [Trade, ...]}}
+        trades_by_data = getattr(strategy, '_trades', None)
+        if not trades_by_data:
+            return np.empty(0)
+        
+        closed = [trade for by_id in trades_by_data.values()
+                  for trade_list in by_id.values()
+                  for trade in trade_list if trade.isclosed]
+        closed.sort(key=lambda trade: trade.dtclose)
+        return np.fromiter((trade.pnlcomm for trade in closed), dtype=np.float64, count=len(closed))
+    
+    @staticmethod
+    def _calculate_streaks(pnl: np.ndarray) -> Tuple[int, int]:
+        """Longest winning and losing streaks via run-length encoding of trade P&L"""
+        
+        if len(pnl) == 0:
+            return 0, 0
+        
+        # Same convention as backtrader's TradeAnalyzer: break-even counts as a win
+        signs = np.where(pnl >= 0, 1, -1).astype(np.int8)
+        run_starts = np.r_[0, np.flatnonzero(np.diff(signs)) + 1]
+        run_lengths = np.diff(np.r_[run_starts, len(signs)])
+        run_signs = signs[run_starts]
+        
+        max_wins = int(run_lengths[run_signs == 1].max(initial=0))
+        max_losses = int(run_lengths[run_signs == -1].max(initial=0))
+        return max_wins, max_losses
+    
     def _calculate_time_analysis(self, returns: pd.Series) -> Dict:
         """Calculate time-based analysis"""
         
@@ -262,8 +311,8 @@ class PerformanceAnalyzer:
         return {
             'mean_return': returns.mean() * 100,
             'std_return': returns.std() * 100,
-            'skewness': stats.skew(returns.dropna()),
-            'kurtosis': stats.kurtosis(returns.dropna()),
+            'skewness': stats.skew(returns),
+            'kurtosis': stats.kurtosis(returns),
             'min_return': returns.min() * 100,
             'max_return': returns.max() * 100
         }
@@ -274,82 +323,110 @@ class PerformanceAnalyzer:
         if len(returns) == 0:
             return {}
         
-        clean_returns = returns.dropna()
+        # Work on one NaN-free ndarray for every statistic below
+        r = returns.to_numpy(dtype=np.float64)
+        r = r[~np.isnan(r)]
         
         # Test for normality
-        shapiro_stat, shapiro_p = stats.shapiro(clean_returns[:5000]) if len(clean_returns) <= 5000 else (0, 1)
-        
-        # Calculate percentiles
-        percentiles = {
-            '1%': np.percentile(clean_returns, 1) * 100,
-            '5%': np.percentile(clean_returns, 5) * 100,
-            '25%': np.percentile(clean_returns, 25) * 100,
-            '50%': np.percentile(clean_returns, 50) * 100,
-            '75%': np.percentile(clean_returns, 75) * 100,
-            '95%': np.percentile(clean_returns, 95) * 100,
-            '99%': np.percentile(clean_returns, 99) * 100
-        }
+        shapiro_stat, shapiro_p = stats.shapiro(r) if len(r) <= 5000 else (0, 1)
+        
+        # Calculate percentiles (single sort for all levels)
+        levels = (1, 5, 25, 50, 75, 95, 99)
+        percentiles = dict(zip((f"{q}%" for q in levels), np.percentile(r, levels) * 100))
         
         return {
             'percentiles': percentiles,
-            'skewness': stats.skew(clean_returns),
-            'kurtosis': stats.kurtosis(clean_returns),
+            'skewness': stats.skew(r),
+            'kurtosis': stats.kurtosis(r),
             'shapiro_test': {
                 'statistic': shapiro_stat,
                 'p_value': shapiro_p,
                 'is_normal': shapiro_p > 0.05
             },
-            'outliers': self._detect_outliers(clean_returns)
+            'outliers': self._detect_outliers(r)
         }
     
-    def _detect_outliers(self, returns: pd.Series, method: str = 'iqr') -> Dict:
-        """Detect outliers in returns"""
+    def _detect_outliers(self, returns: np.ndarray, method: str = 'iqr') -> Dict:
+        """Detect outliers in a NaN-free array of returns"""
         
         if method == 'iqr':
-            Q1 = returns.quantile(0.25)
-            Q3 = returns.quantile(0.75)
+            Q1, Q3 = np.percentile(returns, (25, 75))
             IQR = Q3 - Q1
             lower_bound = Q1 - 1.5 * IQR
             upper_bound = Q3 + 1.5 * IQR
             
-            outliers = returns[(returns < lower_bound) | (returns > upper_bound)]
+            outlier_count = int(np.count_nonzero((returns < lower_bound) | (returns > upper_bound)))
             
             return {
                 'method': 'IQR',
                 'lower_bound': lower_bound * 100,
                 'upper_bound': upper_bound * 100,
-                'outlier_count': len(outliers),
-                'outlier_percentage': (len(outliers) / len(returns)) * 100
+                'outlier_count': outlier_count,
+                'outlier_percentage': (outlier_count / len(returns)) * 100
             }
         
         return {}
     
-    def _calculate_rolling_metrics(self, returns: pd.Series, window: int = 30) -> Dict:
-        """Calculate rolling performance metrics"""
+    def _calculate_rolling_metrics(self, returns: pd.Series, window: int = 30,
+                                   full: bool = False) -> Dict:
+        """Calculate rolling performance metrics
+        
+        Only the float summaries are returned by default; pass ``full=True`` to
+        also get the per-bar series as one DataFrame sharing the returns index.
+        """
         
         if len(returns) < window:
             return {}
         
-        rolling_return = returns.rolling(window=window).mean() * 252 * 100
-        rolling_volatility = returns.rolling(window=window).std() * np.sqrt(252) * 100
-        rolling_sharpe = rolling_return / rolling_volatility
+        r = returns.to_numpy(dtype=np.float64)
+        n = len(r)
+        
+        # Rolling mean/std from windowed differences of running sums
+        csum = np.concatenate(([0.0], np.cumsum(r)))
+        csum_sq = np.concatenate(([0.0], np.cumsum(r * r)))
+        win_sum = csum[window:] - csum[:-window]
+        win_sum_sq = csum_sq[window:] - csum_sq[:-window]
+        win_mean = win_sum / window
+        if window > 1:
+            win_var = np.maximum(win_sum_sq - win_sum * win_mean, 0.0) / (window - 1)
+        else:
+            win_var = np.full_like(win_mean, np.nan)
+        
+        rolling_return = win_mean * 252 * 100
+        rolling_volatility = np.sqrt(win_var) * np.sqrt(252) * 100
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rolling_sharpe = rolling_return / rolling_volatility
         
         # Rolling maximum drawdown
-        cumulative = (1 + returns).cumprod()
-        rolling_max = cumulative.rolling(window=window).max()
-        rolling_dd = ((cumulative - rolling_max) / rolling_max) * 100
-        rolling_max_dd = rolling_dd.rolling(window=window).min()
+        cumulative = np.cumprod(1 + r)
+        rolling_max = np.lib.stride_tricks.sliding_window_view(cumulative, window).max(axis=1)
+        rolling_dd = (cumulative[window - 1:] - rolling_max) / rolling_max * 100
+        if len(rolling_dd) >= window:
+            rolling_max_dd = np.lib.stride_tricks.sliding_window_view(rolling_dd, window).min(axis=1)
+        else:
+            rolling_max_dd = np.empty(0)
         
-        return {
+        metrics = {
             'window': window,
-            'rolling_return': rolling_return,
-            'rolling_volatility': rolling_volatility,
-            'rolling_sharpe': rolling_sharpe,
-            'rolling_max_drawdown': rolling_max_dd,
-            'rolling_return_mean': rolling_return.mean(),
-            'rolling_volatility_mean': rolling_volatility.mean(),
-            'rolling_sharpe_mean': rolling_sharpe.mean()
+            'rolling_return_mean': np.nanmean(rolling_return),
+            'rolling_volatility_mean': np.nanmean(rolling_volatility),
+            'rolling_sharpe_mean': np.nanmean(rolling_sharpe)
         }
+        
+        if full:
+            def _pad(values: np.ndarray) -> np.ndarray:
+                padded = np.full(n, np.nan)
+                padded[n - len(values):] = values
+                return padded
+            
+            metrics['rolling_series'] = pd.DataFrame({
+                'rolling_return': _pad(rolling_return),
+                'rolling_volatility': _pad(rolling_volatility),
+                'rolling_sharpe': _pad(rolling_sharpe),
+                'rolling_max_drawdown': _pad(rolling_max_dd)
+            }, index=returns.index)
+        
+        return metrics
     
     def _calculate_monthly_analysis(self, returns: pd.Series) -> Dict:
         """Calculate monthly return analysis"""
@@ -357,17 +434,15 @@ class PerformanceAnalyzer:
         if len(returns) == 0:
             return {}
         
-        # Resample to monthly
-        monthly_returns = returns.resample('M').apply(lambda x: (1 + x).prod() - 1)
+        # Resample to monthly, compounding via log-returns instead of a per-group lambda
+        monthly_returns = np.expm1(np.log1p(returns).resample('M').sum())
         
         # Create monthly return matrix
         monthly_matrix = {}
-        for date, ret in monthly_returns.items():
-            year = date.year
-            month = date.month
-            if year not in monthly_matrix:
-                monthly_matrix[year] = {}
-            monthly_matrix[year][month] = ret * 100
+        monthly_index = monthly_returns.index
+        for year, month, ret in zip(monthly_index.year, monthly_index.month,
+                                    monthly_returns.to_numpy() * 100):
+            monthly_matrix.setdefault(year, {})[month] = ret
         
         # Monthly statistics
         monthly_stats = {
@@ -396,20 +471,24 @@ class PerformanceAnalyzer:
         market_returns = market_data['Close'].pct_change().dropna()
         
         # Align dates
-        common_dates = returns.index.intersection(market_returns.index)
-        if len(common_dates) == 0:
+        aligned_strategy, aligned_market = self._align_series(returns, market_returns)
+        if len(aligned_strategy) == 0:
             return {}
         
-        aligned_strategy = returns.loc[common_dates]
-        aligned_market = market_returns.loc[common_dates]
-        
+        # Centre both series once; correlation and beta share the same sums
+        a = aligned_strategy.to_numpy(dtype=float)
+        b = aligned_market.to_numpy(dtype=float)
+        da = a - a.mean()
+        db = b - b.mean()
+        cross = da @ db
+        strategy_ss = da @ da
+        market_ss = db @ db
+
         # Calculate correlations
-        correlation = aligned_strategy.corr(aligned_market)
-        
+        correlation = cross / np.sqrt(strategy_ss * market_ss) if strategy_ss > 0 and market_ss > 0 else np.nan
+
         # Beta calculation
-        covariance = np.cov(aligned_strategy, aligned_market)[0, 1]
-        market_variance = np.var(aligned_market)
-        beta = covariance / market_variance if market_variance > 0 else 0
+        beta = cross / market_ss if market_ss > 0 else 0
         
         # Alpha calculation
         market_return = aligned_market.mean() * 252
@@ -424,18 +503,23 @@ class PerformanceAnalyzer:
             'tracking_error': (aligned_strategy - aligned_market).std() * np.sqrt(252) * 100
         }
     
+    @staticmethod
+    def _align_series(left: pd.Series, right: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """Inner-join two series on their dates using positional indexers"""
+        _, left_idx, right_idx = left.index.join(right.index, how='inner', return_indexers=True)
+        left_aligned = left if left_idx is None else left.take(left_idx)
+        right_aligned = right if right_idx is None else right.take(right_idx)
+        return left_aligned, right_aligned
+    
     def calculate_benchmark_comparison(self, strategy_returns: pd.Series, 
                                      benchmark_returns: pd.Series) -> Dict:
         """Compare strategy performance against benchmark"""
         
         # Align the series
-        common_dates = strategy_returns.index.intersection(benchmark_returns.index)
-        if len(common_dates) == 0:
+        strategy_aligned, benchmark_aligned = self._align_series(strategy_returns, benchmark_returns)
+        if len(strategy_aligned) == 0:
             return {}
         
-        strategy_aligned = strategy_returns.loc[common_dates]
-        benchmark_aligned = benchmark_returns.loc[common_dates]
-        
         # Calculate excess returns
         excess_returns = strategy_aligned - benchmark_aligned
         
@@ -452,29 +536,42 @@ class PerformanceAnalyzer:
         # Information ratio
         information_ratio = excess_returns.mean() / excess_returns.std() * np.sqrt(252) if excess_returns.std() > 0 else 0
         
+        # Up/down capture
+        up_capture, down_capture = self._calculate_capture_ratios(strategy_aligned, benchmark_aligned)
+        
         return {
             'excess_return': excess_total * 100,
             'excess_volatility': (strategy_vol - benchmark_vol) * 100,
             'information_ratio': information_ratio,
             'tracking_error': excess_vol * 100,
             'hit_rate': (excess_returns > 0).mean() * 100,
-            'up_capture': self._calculate_capture_ratio(strategy_aligned, benchmark_aligned, up=True),
-            'down_capture': self._calculate_capture_ratio(strategy_aligned, benchmark_aligned, up=False)
+            'up_capture': up_capture,
+            'down_capture': down_capture
         }
     
-    def _calculate_capture_ratio(self, strategy_returns: pd.Series, 
-                                benchmark_returns: pd.Series, up: bool = True) -> float:
-        """Calculate up/down capture ratio"""
-        
-        if up:
-            mask = benchmark_returns > 0
-        else:
-            mask = benchmark_returns < 0
-        
-        if mask.sum() == 0:
-            return 0
-        
-        strategy_avg = strategy_returns[mask].mean()
-        benchmark_avg = benchmark_returns[mask].mean()
-        
-        return (strategy_avg / benchmark_avg) * 100 if benchmark_avg != 0 else 0
\ No newline at end of file
+    def _calculate_capture_ratios(self, strategy_returns: pd.Series,
+                                  benchmark_returns: pd.Series) -> Tuple[float, float]:
+        """Calculate up and down capture ratios in a single pass"""
+        
+        benchmark = np.nan_to_num(benchmark_returns.to_numpy(dtype=np.float64))
+        strategy = strategy_returns.to_numpy(dtype=np.float64)
+        # Skip NaN strategy returns the way Series.mean() does
+        strategy_valid = ~np.isnan(strategy)
+        
+        # Bucket each bar by benchmark direction: 0 = down, 1 = flat, 2 = up
+        buckets = (np.sign(benchmark) + 1).astype(np.intp)
+        counts = np.bincount(buckets, minlength=3)
+        strategy_counts = np.bincount(buckets, weights=strategy_valid, minlength=3)
+        strategy_sums = np.bincount(buckets, weights=np.where(strategy_valid, strategy, 0.0), minlength=3)
+        benchmark_sums = np.bincount(buckets, weights=benchmark, minlength=3)
+        
+        def _ratio(bucket: int) -> float:
+            if counts[bucket] == 0 or benchmark_sums[bucket] == 0:
+                return 0
+            if strategy_counts[bucket] == 0:
+                return np.nan
+            strategy_avg = strategy_sums[bucket] / strategy_counts[bucket]
+            benchmark_avg = benchmark_sums[bucket] / counts[bucket]
+            return (strategy_avg / benchmark_avg) * 100
+        
+        return _ratio(2), _ratio(0)
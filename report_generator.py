@@ -3,9 +3,34 @@ Report Generator Module
 Generates comprehensive trading reports with AI insights
 """
 import json
+import math
 from typing import Dict, Any, List
 from datetime import datetime
+import numpy as np
 import backtrader as bt
+from analysis_utils import dig_analysis, freeze_analysis
+
+try:
+    import orjson
+except ImportError:  # optional fast encoder, stdlib json is used otherwise
+    orjson = None
+
+
+def _json_safe(value: Any) -> Any:
+    """Copy of a report tree that encodes identically with orjson and stdlib json
+
+    NumPy scalars and arrays become plain Python values and non-finite floats
+    become None (written as ``null``), which is what orjson does natively.
+    """
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
 
 
 class ReportGenerator:
@@ -16,9 +41,20 @@ class ReportGenerator:
         self.results = results
         self.config = config
         self.strat = results[0] if results else None
+        # Backtrader strategies always expose an (possibly empty) analyzers collection
+        self._has_analyzers = (self.strat is not None and hasattr(self.strat, 'analyzers')
+                               and len(self.strat.analyzers) > 0)
+        self._metrics_cache = None
+        self._report_cache = None
     
     def generate_performance_metrics(self) -> Dict[str, Any]:
-        """Extract performance metrics from backtest results"""
+        """Extract performance metrics from backtest results (computed once per instance)"""
+        if self._metrics_cache is None:
+            self._metrics_cache = self._compute_performance_metrics()
+        return self._metrics_cache
+    
+    def _compute_performance_metrics(self) -> Dict[str, Any]:
+        """Build the performance metrics dict from the broker and analyzers"""
         metrics = {}
         
         # Basic Performance
@@ -36,7 +72,7 @@ class ReportGenerator:
             'interval': self.config['interval']
         }
         
-        if self.strat is not None and hasattr(self.strat, 'analyzers'):
+        if self._has_analyzers:
             try:
                 # Returns Analysis
                 if hasattr(self.strat.analyzers, 'returns'):
@@ -57,11 +93,11 @@ class ReportGenerator:
                     risk_metrics['sharpe_ratio'] = 'N/A'
                 
                 if hasattr(self.strat.analyzers, 'drawdown'):
-                    drawdown_analysis = self.strat.analyzers.drawdown.get_analysis()
+                    drawdown_analysis = freeze_analysis(self.strat.analyzers.drawdown.get_analysis())
                     risk_metrics.update({
-                        'max_drawdown': drawdown_analysis.get('max', {}).get('drawdown', 0),
-                        'max_drawdown_period': drawdown_analysis.get('max', {}).get('len', 0),
-                        'max_drawdown_money': drawdown_analysis.get('max', {}).get('moneydown', 0)
+                        'max_drawdown': dig_analysis(drawdown_analysis, ('max', 'drawdown')),
+                        'max_drawdown_period': dig_analysis(drawdown_analysis, ('max', 'len')),
+                        'max_drawdown_money': dig_analysis(drawdown_analysis, ('max', 'moneydown'))
                     })
                 else:
                     risk_metrics.update({
@@ -74,23 +110,23 @@ class ReportGenerator:
                 
                 # Trade Analysis
                 if hasattr(self.strat.analyzers, 'trades'):
-                    trades_analysis = self.strat.analyzers.trades.get_analysis()
-                    total_closed = trades_analysis.get('total', {}).get('closed', 0)
+                    trades_analysis = freeze_analysis(self.strat.analyzers.trades.get_analysis())
+                    total_closed = dig_analysis(trades_analysis, ('total', 'closed'))
+                    winning_trades = dig_analysis(trades_analysis, ('won', 'total'))
                     
                     metrics['trades'] = {
-                        'total_trades': trades_analysis.get('total', {}).get('total', 0),
-                        'open_trades': trades_analysis.get('total', {}).get('open', 0),
+                        'total_trades': dig_analysis(trades_analysis, ('total', 'total')),
+                        'open_trades': dig_analysis(trades_analysis, ('total', 'open')),
                         'closed_trades': total_closed,
-                        'winning_trades': trades_analysis.get('won', {}).get('total', 0),
-                        'losing_trades': trades_analysis.get('lost', {}).get('total', 0),
-                        'win_rate': 0 if total_closed == 0 else 
-                                   trades_analysis.get('won', {}).get('total', 0) / total_closed * 100,
-                        'avg_win': trades_analysis.get('won', {}).get('pnl', {}).get('average', 0),
-                        'avg_loss': trades_analysis.get('lost', {}).get('pnl', {}).get('average', 0),
-                        'best_trade': trades_analysis.get('won', {}).get('pnl', {}).get('max', 0),
-                        'worst_trade': trades_analysis.get('lost', {}).get('pnl', {}).get('max', 0),
-                        'max_consecutive_wins': trades_analysis.get('streak', {}).get('won', {}).get('longest', 0),
-                        'max_consecutive_losses': trades_analysis.get('streak', {}).get('lost', {}).get('longest', 0)
+                        'winning_trades': winning_trades,
+                        'losing_trades': dig_analysis(trades_analysis, ('lost', 'total')),
+                        'win_rate': 0 if total_closed == 0 else winning_trades / total_closed * 100,
+                        'avg_win': dig_analysis(trades_analysis, ('won', 'pnl', 'average')),
+                        'avg_loss': dig_analysis(trades_analysis, ('lost', 'pnl', 'average')),
+                        'best_trade': dig_analysis(trades_analysis, ('won', 'pnl', 'max')),
+                        'worst_trade': dig_analysis(trades_analysis, ('lost', 'pnl', 'max')),
+                        'max_consecutive_wins': dig_analysis(trades_analysis, ('streak', 'won', 'longest')),
+                        'max_consecutive_losses': dig_analysis(trades_analysis, ('streak', 'lost', 'longest'))
                     }
                 else:
                     # Default trade metrics when analyzer is not available
@@ -130,22 +166,32 @@ class ReportGenerator:
             except Exception as e:
                 print(f"Warning: Error extracting analyzer data: {e}")
                 # Provide default metrics if analyzers fail
-                metrics['risk'] = {
-                    'sharpe_ratio': 'N/A',
-                    'max_drawdown': 0,
-                    'max_drawdown_period': 0,
-                    'max_drawdown_money': 0
-                }
-                metrics['trades'] = {
-                    'total_trades': 0, 'open_trades': 0, 'closed_trades': 0,
-                    'winning_trades': 0, 'losing_trades': 0, 'win_rate': 0,
-                    'avg_win': 0, 'avg_loss': 0, 'best_trade': 0, 'worst_trade': 0,
-                    'max_consecutive_wins': 0, 'max_consecutive_losses': 0
-                }
-                metrics['system_quality'] = {'sqn': 'N/A', 'sqn_trades': 'N/A', 'vwr': 'N/A'}
+                metrics.update(self._default_analyzer_metrics())
+        elif self.strat is not None:
+            # No analyzers configured, skip the lookups entirely
+            metrics.update(self._default_analyzer_metrics())
         
         return metrics
     
+    @staticmethod
+    def _default_analyzer_metrics() -> Dict[str, Any]:
+        """Default risk/trade/quality metrics used when analyzer data is unavailable"""
+        return {
+            'risk': {
+                'sharpe_ratio': 'N/A',
+                'max_drawdown': 0,
+                'max_drawdown_period': 0,
+                'max_drawdown_money': 0
+            },
+            'trades': {
+                'total_trades': 0, 'open_trades': 0, 'closed_trades': 0,
+                'winning_trades': 0, 'losing_trades': 0, 'win_rate': 0,
+                'avg_win': 0, 'avg_loss': 0, 'best_trade': 0, 'worst_trade': 0,
+                'max_consecutive_wins': 0, 'max_consecutive_losses': 0
+            },
+            'system_quality': {'sqn': 'N/A', 'sqn_trades': 'N/A', 'vwr': 'N/A'}
+        }
+    
     def generate_ai_insights(self, metrics: Dict[str, Any]) -> str:
         """Generate AI-powered insights from the metrics"""
         # This is a placeholder for AI integration
@@ -206,6 +252,9 @@ class ReportGenerator:
     
     def generate_full_report(self) -> Dict[str, Any]:
         """Generate complete trading report"""
+        if self._report_cache is not None:
+            return self._report_cache
+        
         metrics = self.generate_performance_metrics()
         
         report = {
@@ -217,6 +266,7 @@ class ReportGenerator:
             'summary': self._generate_summary(metrics)
         }
         
+        self._report_cache = report
         return report
     
     def _generate_summary(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
@@ -231,10 +281,21 @@ class ReportGenerator:
         }
     
     def save_report(self, filename: str = 'trading_report.json'):
-        """Save report to file"""
-        report = self.generate_full_report()
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=4)
+        """Save report to file
+
+        Written as UTF-8 with 2-space indentation, NaN/inf as ``null`` and
+        datetimes through ``str`` whether or not orjson is installed.
+        """
+        report = _json_safe(self.generate_full_report())
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    report, default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                ))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, default=str, ensure_ascii=False)
         print(f"Report saved to {filename}")
     
     def print_report(self):
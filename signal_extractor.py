@@ -1,19 +1,208 @@
 """
 Signal extraction utilities for Scalparo Trading Backtester
 """
+import copy
+import hashlib
+import weakref
+from collections import Counter, OrderedDict
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 import backtrader as bt
 
 
+# Backtrader stores datetimes as float day numbers (proleptic ordinal plus
+# day fraction); this is the day number of 1970-01-01.
+_BT_UNIX_EPOCH_DAYNUM = 719163
+
+# Extracted signal dicts of recent backtests, keyed by _extraction_key (LRU)
+_EXTRACTION_CACHE: 'OrderedDict[Tuple[type, str], Dict]' = OrderedDict()
+_EXTRACTION_CACHE_SIZE = 64
+
+# Close-price copy of each live cerebro's first feed, with the line array and
+# length it was taken from; entries go away with the cerebro
+_CLOSE_BUFFERS: 'weakref.WeakKeyDictionary[bt.Cerebro, Tuple[object, int, np.ndarray]]' = weakref.WeakKeyDictionary()
+
+
+def line_buffer(line) -> np.ndarray:
+    """Float64 ndarray over a backtrader line's raw ``array`` storage
+
+    ``line.array`` is the canonical per-bar buffer behind ``line[i]`` (an
+    ``array.array('d')`` for unbounded feeds), so this is a zero-copy view in
+    the common case and avoids LineBuffer's per-access index arithmetic.
+    """
+    return np.asarray(line.array, dtype=np.float64)
+
+
+def bt_nums_to_datetimes(nums) -> pd.DatetimeIndex:
+    """Convert an array of backtrader float datetimes to a DatetimeIndex in one call
+
+    Mirrors ``bt.num2date`` step for step (whole days first, then hour,
+    minute, second and microsecond from the day fraction, with the same
+    near-zero/near-one microsecond corrections), so the results match it
+    exactly instead of drifting by a few microseconds.
+    """
+    nums = np.asarray(nums, dtype=np.float64)
+    missing = np.isnan(nums)
+    nums = np.where(missing, _BT_UNIX_EPOCH_DAYNUM, nums)
+    days = np.floor(nums)
+    hour, rem = np.divmod((nums - days) * 24.0, 1)
+    minute, rem = np.divmod(rem * 60.0, 1)
+    second, rem = np.divmod(rem * 60.0, 1)
+    micro = np.trunc(rem * 1e6).astype(np.int64)
+    micro[micro < 10] = 0
+    # num2date rounds 999991..999999 up to the next whole second
+    micro[micro > 999990] = 1000000
+
+    total_us = ((days.astype(np.int64) - _BT_UNIX_EPOCH_DAYNUM) * 86400
+                + hour.astype(np.int64) * 3600 + minute.astype(np.int64) * 60
+                + second.astype(np.int64)) * 1000000 + micro
+    stamps = total_us.astype('datetime64[us]').astype('datetime64[ns]')
+    stamps[missing] = np.datetime64('NaT')
+    return pd.DatetimeIndex(stamps)
+
+
+def close_buffer(cerebro: bt.Cerebro) -> np.ndarray:
+    """Close prices of cerebro's first data feed, built once per run and shared
+
+    The cache holds a copy rather than a view, so backtrader can still resize
+    the live array, and it is rebuilt when the feed's buffer changes (a rerun
+    of the same cerebro).
+    """
+    if not cerebro.datas:
+        return np.empty(0)
+    array = cerebro.datas[0].close.array
+    cached = _CLOSE_BUFFERS.get(cerebro)
+    if cached is not None and cached[0] is array and cached[1] == len(array):
+        return cached[2]
+    prices = np.array(array, dtype=np.float64)
+    _CLOSE_BUFFERS[cerebro] = (array, len(array), prices)
+    return prices
+
+
+def _extraction_key(cerebro: bt.Cerebro, strategy) -> Optional[Tuple[type, str]]:
+    """Key identifying a backtest run, or None if it cannot be built
+
+    The strategy class object itself is part of the key, so a custom strategy
+    reloaded from an edited file (same module and class name) is a miss. The
+    rest is a content hash of everything that shapes the trades: strategy
+    params, cerebro and broker settings (cash, slippage, cheat-on-open, ...),
+    the commission scheme, the sizers and every line of every data feed.
+    """
+    try:
+        broker = cerebro.broker
+        parts = (
+            tuple(strategy.params._getitems()),
+            tuple(cerebro.p._getitems()),
+            tuple(item for item in broker.p._getitems() if item[0] != 'commission'),
+            getattr(broker, 'startingcash', None),
+            sorted(cerebro.sizers.items(), key=repr),
+        )
+        digest = hashlib.sha256(repr(parts).encode())
+        for data_feed in cerebro.datas:
+            digest.update(repr(tuple(broker.getcommissioninfo(data_feed).p._getitems())).encode())
+            for alias in data_feed.lines.getlinealiases():
+                digest.update(alias.encode())
+                digest.update(np.ascontiguousarray(line_buffer(getattr(data_feed.lines, alias))))
+    except Exception:
+        return None
+    return strategy.__class__, digest.hexdigest()
+
+
+class SignalBuffer:
+    """Growable struct-of-arrays store for one side's signals
+
+    Prices live in a contiguous float64 buffer and timestamps in an object
+    buffer, both doubled in place when full; reasons stay a plain list.
+    Indexing by the legacy column names ('timestamp', 'price', 'reason')
+    returns the filled part of the matching column.
+    """
+
+    _COLUMNS = {'timestamp': 'timestamps', 'price': 'prices', 'reason': 'reasons'}
+
+    def __init__(self, capacity: int = 64):
+        self._timestamps = np.empty(capacity, dtype=object)
+        self._prices = np.empty(capacity, dtype=np.float64)
+        self.reasons = []
+        self.n = 0
+
+    def append(self, timestamp, price: float, reason: str = "") -> None:
+        """Add one signal, growing the buffers if needed"""
+        if self.n == len(self._prices):
+            self._grow()
+        self._timestamps[self.n] = timestamp
+        self._prices[self.n] = price
+        self.reasons.append(reason)
+        self.n += 1
+
+    def extend(self, timestamps, prices, reasons: List[str]) -> None:
+        """Add a batch of signals with one slice assignment per buffer"""
+        count = len(reasons)
+        if self.n + count > len(self._prices):
+            self._grow(self.n + count)
+        self._timestamps[self.n:self.n + count] = timestamps
+        self._prices[self.n:self.n + count] = prices
+        self.reasons.extend(reasons)
+        self.n += count
+
+    def _grow(self, minimum: int = 0) -> None:
+        capacity = max(1, 2 * len(self._prices), minimum)
+        timestamps = np.empty(capacity, dtype=object)
+        prices = np.empty(capacity, dtype=np.float64)
+        timestamps[:self.n] = self._timestamps[:self.n]
+        prices[:self.n] = self._prices[:self.n]
+        self._timestamps, self._prices = timestamps, prices
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[:self.n]
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._prices[:self.n]
+
+    def __len__(self) -> int:
+        return self.n
+
+    def to_dict(self) -> Dict[str, List]:
+        """Legacy dict-of-lists form ({'timestamp': [...], 'price': [...], 'reason': [...]})"""
+        return {
+            'timestamp': self.timestamps.tolist(),
+            'price': self.prices.tolist(),
+            'reason': list(self.reasons)
+        }
+
+    def __getitem__(self, column: str):
+        return getattr(self, self._COLUMNS[column])
+
+
 class SignalExtractor:
     """Extracts trading signals from backtest results for visualization"""
 
+    __slots__ = ('_signals', '_prices_np')
+
     def __init__(self):
-        self.signals = {
-            'buy_signals': {'timestamp': [], 'price': [], 'reason': []},
-            'sell_signals': {'timestamp': [], 'price': [], 'reason': []},
+        # Built on first access; extractors used only for formatting never need it
+        self._signals = None
+        # Close prices of the last extracted backtest (see close_buffer)
+        self._prices_np = None
+
+    @property
+    def signals(self) -> Dict:
+        if self._signals is None:
+            self._signals = self._empty_signals()
+        return self._signals
+
+    @signals.setter
+    def signals(self, value: Dict) -> None:
+        self._signals = value
+
+    @staticmethod
+    def _empty_signals() -> Dict:
+        """Fresh, empty signal structure"""
+        return {
+            'buy_signals': SignalBuffer(),
+            'sell_signals': SignalBuffer(),
             'trades': [],
             'execution_prices': {
                 'buy_executions': [],
@@ -31,50 +220,50 @@ class SignalExtractor:
             return self.signals
 
         strategy = results[0]
+        try:
+            self._prices_np = close_buffer(cerebro)
+        except Exception:
+            self._prices_np = None
+
+        # Identical backtests (same strategy, params, broker and data) reuse a cached extraction
+        key = _extraction_key(cerebro, strategy)
+        if key is not None and key in _EXTRACTION_CACHE:
+            _EXTRACTION_CACHE.move_to_end(key)
+            # Hand out a copy so callers cannot mutate the shared entry
+            self.signals = copy.deepcopy(_EXTRACTION_CACHE[key])
+            return self.signals
+
+        # Start from empty signals so a reused extractor does not mix runs
+        self.signals = self._empty_signals()
         
         # Extract execution prices if available
         self._extract_execution_prices(strategy)
 
-        # Extract data safely
+        # Extract data safely: bulk-copy the close and datetime line buffers
         dates = []
-        prices = []
+        prices = np.empty(0)
 
         try:
             if cerebro.datas:
                 data_feed = cerebro.datas[0]
-
-                # Get the length of available data
-                data_len = len(data_feed.close.array)
-
-                # Extract price data safely
-                for i in range(data_len):
-                    try:
-                        # Try to get datetime - handle potential errors
-                        if hasattr(data_feed, 'datetime') and hasattr(data_feed.datetime, 'array'):
-                            if i < len(data_feed.datetime.array):
-                                dates.append(data_feed.datetime.datetime(i))
-                            else:
-                                # Fallback to index-based date
-                                dates.append(f"Period_{i}")
-                        else:
-                            dates.append(f"Period_{i}")
-
-                        # Get price data
-                        if i < len(data_feed.close.array):
-                            prices.append(data_feed.close[i])
-                        else:
-                            prices.append(0.0)
-
-                    except (IndexError, AttributeError) as e:
-                        # If we can't get the data, use fallback values
-                        dates.append(f"Period_{i}")
-                        prices.append(0.0)
+                prices = close_buffer(cerebro)
+
+                # Resolve the datetime buffer once rather than probing it per bar
+                dt_line = getattr(data_feed, 'datetime', None)
+                if hasattr(dt_line, 'array'):
+                    dt_nums = line_buffer(dt_line)
+                    # Both lines normally share a length; trim to the common span
+                    n = min(len(prices), len(dt_nums))
+                    prices = prices[:n]
+                    dates = bt_nums_to_datetimes(dt_nums[:n])
+                else:
+                    dates = [f"Period_{i}" for i in range(len(prices))]
 
         except Exception as e:
             print(f"Warning: Could not extract data from cerebro: {e}")
             # Use minimal fallback data
             dates = ["Period_0"]
-            prices = [100.0]
+            prices = np.array([100.0])
 
         # Extract trade data from analyzer
         try:
@@ -96,6 +285,11 @@ class SignalExtractor:
             # Create minimal fallback signals
             self._create_fallback_signals(dates, prices)
 
+        if key is not None:
+            _EXTRACTION_CACHE[key] = copy.deepcopy(self.signals)
+            if len(_EXTRACTION_CACHE) > _EXTRACTION_CACHE_SIZE:
+                _EXTRACTION_CACHE.popitem(last=False)
+
         return self.signals
 
     def _extract_trade_data(self, trade_analysis: Dict, dates: List, prices: List) -> None:
@@ -123,19 +317,24 @@ class SignalExtractor:
             lost = trade_data['lost'].get('total', 0) if 'lost' in trade_data else 0
 
             # Add trade summary to our signals
-            for i in range(total):
-                trade_info = {
+            trades = self.signals['trades']
+            start_n = len(trades)
+            new_trades = [
+                {
                     'direction': direction,
                     'result': 'win' if i < won else 'loss',
-                    'trade_number': len(self.signals['trades']) + 1
+                    'trade_number': start_n + i + 1
                 }
+                for i in range(total)
+            ]
 
-                # Add P&L if available
-                if 'pnl' in trade_data and 'total' in trade_data['pnl']:
-                    avg_pnl = trade_data['pnl']['total'] / total if total > 0 else 0
+            # Add P&L if available (the same per-trade average for every record)
+            if total > 0 and 'pnl' in trade_data and 'total' in trade_data['pnl']:
+                avg_pnl = trade_data['pnl']['total'] / total
+                for trade_info in new_trades:
                     trade_info['pnl'] = avg_pnl
 
-                self.signals['trades'].append(trade_info)
+            trades.extend(new_trades)
 
     def _extract_strategy_signals(self, strategy_signals: List) -> None:
         """Extract signals from strategy that implements signal logging"""
@@ -147,13 +346,9 @@ class SignalExtractor:
             reason = signal.get('reason', '')
 
             if signal_type.lower() == 'buy':
-                self.signals['buy_signals']['timestamp'].append(timestamp)
-                self.signals['buy_signals']['price'].append(price)
-                self.signals['buy_signals']['reason'].append(reason)
+                self.signals['buy_signals'].append(timestamp, price, reason)
             elif signal_type.lower() == 'sell':
-                self.signals['sell_signals']['timestamp'].append(timestamp)
-                self.signals['sell_signals']['price'].append(price)
-                self.signals['sell_signals']['reason'].append(reason)
+                self.signals['sell_signals'].append(timestamp, price, reason)
 
     def _infer_signals_from_trades(self, dates: List, prices: List) -> None:
         """Fallback method to infer signals from trade data when not explicitly logged"""
@@ -166,21 +361,29 @@ class SignalExtractor:
         # Distribute trades across the time period
         interval = max(1, len(dates) // (total_trades * 2))  # *2 for buy and sell
 
-        for i, trade in enumerate(self.signals['trades']):
-            # Calculate approximate timestamps for buy/sell signals
-            buy_index = min(i * interval * 2, len(dates) - 1)
-            sell_index = min((i * interval * 2) + interval, len(dates) - 1)
-
-            # Add buy signal
-            self.signals['buy_signals']['timestamp'].append(dates[buy_index])
-            self.signals['buy_signals']['price'].append(prices[buy_index])
-            self.signals['buy_signals']['reason'].append(f"Trade #{i+1} entry")
-
-            # Add sell signal
-            self.signals['sell_signals']['timestamp'].append(dates[sell_index])
-            self.signals['sell_signals']['price'].append(prices[sell_index])
-            result = "profit" if trade.get('result') == 'win' else "loss"
-            self.signals['sell_signals']['reason'].append(f"Trade #{i+1} exit ({result})")
+        # Approximate bar indices for every buy/sell signal, gathered in one go
+        last = len(dates) - 1
+        buy_index = np.minimum(np.arange(total_trades) * (interval * 2), last)
+        sell_index = np.minimum(buy_index + interval, last)
+        dates = np.asarray(dates, dtype=object)
+        prices = np.asarray(prices, dtype=np.float64)
+
+        self.signals['buy_signals'].extend(
+            dates[buy_index], prices[buy_index],
+            [f"Trade #{i+1} entry" for i in range(total_trades)])
+
+        self.signals['sell_signals'].extend(
+            dates[sell_index], prices[sell_index],
+            [f"Trade #{i+1} exit ({'profit' if trade.get('result') == 'win' else 'loss'})"
+             for i, trade in enumerate(self.signals['trades'])])
+
+    @staticmethod
+    def signals_to_dict(signals: Dict) -> Dict:
+        """JSON-friendly copy of a signals dict, with signal buffers as dicts of lists"""
+        return {
+            key: value.to_dict() if isinstance(value, SignalBuffer) else value
+            for key, value in signals.items()
+        }
 
     def format_for_plotting(self, signals: Dict) -> Dict:
         """Format signals for plotting with chart components"""
@@ -188,23 +391,25 @@ class SignalExtractor:
         formatted = {}
 
         # Format buy signals
-        if signals['buy_signals']['timestamp']:
-            formatted['buy_signals'] = pd.DataFrame({
-                'timestamp': signals['buy_signals']['timestamp'],
-                'price': signals['buy_signals']['price'],
-                'reason': signals['buy_signals']['reason']
-            })
+        if len(signals['buy_signals']):
+            formatted['buy_signals'] = self._signal_frame(signals['buy_signals'])
 
         # Format sell signals  
-        if signals['sell_signals']['timestamp']:
-            formatted['sell_signals'] = pd.DataFrame({
-                'timestamp': signals['sell_signals']['timestamp'],
-                'price': signals['sell_signals']['price'],
-                'reason': signals['sell_signals']['reason']
-            })
+        if len(signals['sell_signals']):
+            formatted['sell_signals'] = self._signal_frame(signals['sell_signals'])
 
         return formatted
 
+    @staticmethod
+    def _signal_frame(buffer: SignalBuffer) -> pd.DataFrame:
+        """Wrap a signal buffer's columns in a DataFrame without copying them"""
+        return pd.DataFrame({
+            # pd.Index infers datetime64 from the object timestamp buffer
+            'timestamp': pd.Index(buffer.timestamps),
+            'price': buffer.prices,
+            'reason': pd.array(buffer.reasons, dtype='string')
+        }, copy=False)
+
     def get_trade_markers(self, trades: List[Dict]) -> Dict:
         """Get trade markers for visualization"""
 
@@ -242,8 +447,13 @@ class SignalExtractor:
             'sell_markers': sell_markers
         }
 
-    def calculate_signal_performance(self, signals: Dict, prices: pd.Series) -> Dict:
-        """Calculate performance metrics for the signals"""
+    def calculate_signal_performance(self, signals: Dict, prices: Optional[pd.Series] = None) -> Dict:
+        """Calculate performance metrics for the signals
+
+        prices defaults to the close buffer of the last extracted backtest.
+        """
+        if prices is None:
+            prices = self._prices_np if self._prices_np is not None else []
 
         performance = {
             'total_signals': 0,
@@ -254,18 +464,20 @@ class SignalExtractor:
         }
 
         # Count signals
-        performance['buy_signals'] = len(signals['buy_signals']['timestamp'])
-        performance['sell_signals'] = len(signals['sell_signals']['timestamp'])
-        performance['total_signals'] = performance['buy_signals'] + performance['sell_signals']
+        buy_prices = signals['buy_signals'].prices
+        sell_prices = signals['sell_signals'].prices
+        performance['buy_signals'] = len(buy_prices)
+        performance['sell_signals'] = len(sell_prices)
+        total_signals = performance['buy_signals'] + performance['sell_signals']
+        performance['total_signals'] = total_signals
 
         # Calculate frequency
         if len(prices) > 0:
-            performance['signal_frequency'] = performance['total_signals'] / len(prices)
+            performance['signal_frequency'] = total_signals / len(prices)
 
-        # Calculate average signal price
-        all_prices = signals['buy_signals']['price'] + signals['sell_signals']['price']
-        if all_prices:
-            performance['avg_signal_price'] = np.mean(all_prices)
+        # Calculate average signal price from the contiguous price buffers
+        if total_signals:
+            performance['avg_signal_price'] = (buy_prices.sum() + sell_prices.sum()) / total_signals
 
         return performance
 
@@ -290,104 +502,122 @@ class SignalExtractor:
                     for i, line in enumerate(indicator.lines):
                         line_name = getattr(line, '_name', f"{attr_name}_{i}")
                         if hasattr(line, 'array'):
-                            values = line.array[~np.isnan(line.array)]
+                            values = self._non_nan_values(line_buffer(line))
                             if len(values) > 0:
-                                indicators[f"{attr_name}_{line_name}"] = pd.Series(values)
+                                indicators[f"{attr_name}_{line_name}"] = pd.Series(values, copy=False)
                 elif hasattr(indicator, 'array'):
                     # Single-line indicator
-                    values = indicator.array[~np.isnan(indicator.array)]
+                    values = self._non_nan_values(line_buffer(indicator))
                     if len(values) > 0:
-                        indicators[attr_name] = pd.Series(values)
+                        indicators[attr_name] = pd.Series(values, copy=False)
 
         return indicators
 
+    @staticmethod
+    def _non_nan_values(arr: np.ndarray) -> np.ndarray:
+        """Drop NaNs from an indicator buffer, slicing when they are only warm-up padding"""
+        nan_mask = np.isnan(arr)
+        if not nan_mask.any():
+            return arr
+
+        # Indicators are NaN only until their period fills, so usually a slice suffices
+        first_valid = np.argmax(~nan_mask)
+        if not nan_mask[first_valid:].any():
+            return arr[first_valid:]
+        return arr[~nan_mask]
+
     def create_signal_summary(self, signals: Dict) -> Dict:
         """Create a summary of signal analysis"""
 
+        trades = signals['trades']
+
+        # Win/loss tally and P&L reductions without per-trade Python arithmetic
+        counts = Counter(trade.get('result') for trade in trades)
+        winning_trades = counts['win']
+        losing_trades = counts['loss']
+        pnls = np.fromiter((trade['pnl'] for trade in trades if 'pnl' in trade), dtype=np.float64)
+
+        total_trades = winning_trades + losing_trades
+
         summary = {
             'signal_stats': {
-                'total_buy_signals': len(signals['buy_signals']['timestamp']),
-                'total_sell_signals': len(signals['sell_signals']['timestamp']),
-                'total_trades': len(signals['trades'])
+                'total_buy_signals': len(signals['buy_signals']),
+                'total_sell_signals': len(signals['sell_signals']),
+                'total_trades': len(trades)
             },
             'trade_stats': {
-                'winning_trades': len([t for t in signals['trades'] if t.get('result') == 'win']),
-                'losing_trades': len([t for t in signals['trades'] if t.get('result') == 'loss']),
-                'win_rate': 0
+                'winning_trades': winning_trades,
+                'losing_trades': losing_trades,
+                'win_rate': (winning_trades / total_trades) * 100 if total_trades > 0 else 0,
+                'avg_pnl': float(pnls.mean()) if pnls.size else 0,
+                'total_pnl': float(pnls.sum()) if pnls.size else 0
             }
         }
 
-        # Calculate win rate
-        total_trades = summary['trade_stats']['winning_trades'] + summary['trade_stats']['losing_trades']
-        if total_trades > 0:
-            summary['trade_stats']['win_rate'] = (summary['trade_stats']['winning_trades'] / total_trades) * 100
-
-        # Calculate average P&L
-        trade_pnls = [t.get('pnl', 0) for t in signals['trades'] if 'pnl' in t]
-        if trade_pnls:
-            summary['trade_stats']['avg_pnl'] = np.mean(trade_pnls)
-            summary['trade_stats']['total_pnl'] = np.sum(trade_pnls)
-        else:
-            summary['trade_stats']['avg_pnl'] = 0
-            summary['trade_stats']['total_pnl'] = 0
-
         return summary
 
     def _create_fallback_signals(self, dates: List, prices: List) -> None:
         """Create minimal fallback signals when extraction fails"""
         if len(dates) > 0 and len(prices) > 0:
             # Create a simple buy signal at the beginning
-            self.signals['buy_signals']['timestamp'].append(dates[0])
-            self.signals['buy_signals']['price'].append(prices[0])
-            self.signals['buy_signals']['reason'].append("Fallback buy signal")
+            self.signals['buy_signals'].append(dates[0], prices[0], "Fallback buy signal")
 
             # Create a simple sell signal at the end if we have more than one data point
             if len(dates) > 1:
-                self.signals['sell_signals']['timestamp'].append(dates[-1])
-                self.signals['sell_signals']['price'].append(prices[-1])
-                self.signals['sell_signals']['reason'].append("Fallback sell signal")
+                self.signals['sell_signals'].append(dates[-1], prices[-1], "Fallback sell signal")
 
     def _extract_execution_prices(self, strategy) -> None:
         """Extract execution prices from strategy order history"""
-        buy_executions = []
-        sell_executions = []
-        
-        # Try to get execution data from strategy if it has logged orders
+        if hasattr(strategy, '_buy_px') and hasattr(strategy, '_sell_px'):
+            # Columnar log (BaseStrategy): zero-copy views over the price buffers
+            self._store_execution_prices(np.frombuffer(strategy._buy_px, dtype=np.float64),
+                                         np.frombuffer(strategy._sell_px, dtype=np.float64))
+            return
+
+        # Classify every record in one pass into (side code, price) pairs:
+        # +1 buy, -1 sell, 0 anything else
         if hasattr(strategy, '_execution_log'):
-            for execution in strategy._execution_log:
-                if execution['side'] == 'buy':
-                    buy_executions.append(execution['price'])
-                elif execution['side'] == 'sell':
-                    sell_executions.append(execution['price'])
-        else:
+            records = ((1 if e['side'] == 'buy' else -1 if e['side'] == 'sell' else 0, e['price'])
+                       for e in strategy._execution_log)
+        elif hasattr(strategy, '_signals') and strategy._signals:
             # Fallback: try to extract from signals if available
-            if hasattr(strategy, '_signals') and strategy._signals:
-                for signal in strategy._signals:
-                    if signal.get('type', '').lower() == 'buy':
-                        buy_executions.append(signal.get('price', 0))
-                    elif signal.get('type', '').lower() == 'sell':
-                        sell_executions.append(signal.get('price', 0))
-        
+            records = ((1 if s.get('type', '').lower() == 'buy' else
+                        -1 if s.get('type', '').lower() == 'sell' else 0, s.get('price', 0))
+                       for s in strategy._signals)
+        else:
+            records = iter(())
+
+        executions = np.fromiter(records, dtype=[('side', np.int8), ('price', np.float64)])
+        self._store_execution_prices(executions['price'][executions['side'] == 1],
+                                     executions['price'][executions['side'] == -1])
+
+    def _store_execution_prices(self, buy_prices: np.ndarray, sell_prices: np.ndarray) -> None:
+        """Record per-side execution prices and their averages"""
         # Store execution prices
-        self.signals['execution_prices']['buy_executions'] = buy_executions
-        self.signals['execution_prices']['sell_executions'] = sell_executions
-        self.signals['execution_prices']['total_executions'] = len(buy_executions) + len(sell_executions)
-        
+        execution_prices = self.signals['execution_prices']
+        execution_prices['buy_executions'] = buy_prices.tolist()
+        execution_prices['sell_executions'] = sell_prices.tolist()
+        execution_prices['total_executions'] = buy_prices.size + sell_prices.size
+
         # Calculate averages
-        if buy_executions:
-            self.signals['execution_prices']['average_buy_price'] = sum(buy_executions) / len(buy_executions)
-        if sell_executions:
-            self.signals['execution_prices']['average_sell_price'] = sum(sell_executions) / len(sell_executions)
+        if buy_prices.size:
+            execution_prices['average_buy_price'] = float(buy_prices.mean())
+        if sell_prices.size:
+            execution_prices['average_sell_price'] = float(sell_prices.mean())
 
 
 class StrategySignalLogger:
     """Mixin class for strategies to log signals during execution"""
 
-    def __init__(self):
+    def __init__(self, enabled: bool = True):
         self._signals = []
+        # Off when nobody will read the log (e.g. optimization sweeps)
+        self._signals_enabled = enabled
 
     def log_signal(self, signal_type: str, price: float, reason: str = "", timestamp=None):
         """Log a trading signal"""
+        if not self._signals_enabled:
+            return
 
         if timestamp is None:
             timestamp = self.datetime.datetime()
@@ -401,6 +631,25 @@ class StrategySignalLogger:
 
         self._signals.append(signal)
 
+    def log_signals_bulk(self, timestamps, sides, prices, reason_codes, reason_labels):
+        """Log a batch of signals in one extend
+
+        sides holds +1 for buy and -1 for sell; reason_codes index into
+        reason_labels, so callers pass small ints instead of a string per row.
+        """
+        if not self._signals_enabled:
+            return
+
+        self._signals.extend(
+            {
+                'type': 'buy' if side > 0 else 'sell',
+                'timestamp': timestamp,
+                'price': float(price),
+                'reason': reason_labels[code]
+            }
+            for timestamp, side, price, code in zip(timestamps, sides, prices, reason_codes)
+        )
+
     def log_buy_signal(self, price: float, reason: str = ""):
         """Log a buy signal"""
         self.log_signal('buy', price, reason)
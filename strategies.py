@@ -3,8 +3,21 @@ Trading Strategies Module
 Contains plug-and-play trading strategies with signal logging
 """
 import backtrader as bt
-from typing import Dict, Any
+import bisect
+import heapq
+import numpy as np
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, NamedTuple
 from base_strategy import BaseStrategy
+from indicators import FastBollingerBands, FastCrossOver, FastRSI, FastSMA, FibLevels
+from signal_extractor import line_buffer
+import vectorized_signals
+
+
+def freeze_params(params: Dict[str, Dict[str, Any]]) -> Mapping[str, Mapping[str, Any]]:
+    """Read-only view of get_params() metadata, safe to share between callers"""
+    return MappingProxyType({name: MappingProxyType(dict(info)) for name, info in params.items()})
 
 
 class SMAStrategy(BaseStrategy):
@@ -17,10 +30,11 @@ class SMAStrategy(BaseStrategy):
     
     def _initialize_indicators(self):
         """Initialize SMA indicators"""
-        self.sma = bt.indicators.SimpleMovingAverage(
-            self.data.close, period=self.params.sma_period
-        )
-        self.crossover = bt.indicators.CrossOver(self.data.close, self.sma)
+        self.sma = FastSMA(self.data.close, period=self.params.sma_period)
+        self.crossover = FastCrossOver(self.data.close, self.sma)
+        # The period is fixed for the run, so the reasons are too
+        self._buy_reason = f"Price crossed above SMA({self.params.sma_period})"
+        self._sell_reason = f"Price crossed below SMA({self.params.sma_period})"
     
     def should_buy(self) -> bool:
         """Buy when price crosses above SMA"""
@@ -30,26 +44,37 @@ class SMAStrategy(BaseStrategy):
         """Sell when price crosses below SMA"""
         return self.crossover[0] < 0
     
+    def _precompute_signals(self):
+        """Crossover signs over the whole series"""
+        crossover = line_buffer(self.crossover)
+        return crossover > 0, crossover < 0
+    
+    @classmethod
+    def _vectorized_signals(cls, prices, params):
+        return vectorized_signals.sma_cross_signals(prices['close'], params['sma_period'])
+    
     def get_buy_reason(self) -> str:
         """Get reason for buy signal"""
-        return f"Price crossed above SMA({self.params.sma_period})"
+        return self._buy_reason
     
     def get_sell_reason(self) -> str:
         """Get reason for sell signal"""
-        return f"Price crossed below SMA({self.params.sma_period})"
+        return self._sell_reason
+    
+    _PARAMS = freeze_params({
+        'sma_period': {
+            'type': 'int',
+            'default': 15,
+            'min': 5,
+            'max': 200,
+            'description': 'Simple Moving Average period'
+        }
+    })
     
     @classmethod
-    def get_params(cls) -> Dict[str, Any]:
+    def get_params(cls) -> Mapping[str, Any]:
         """Get strategy parameters for UI"""
-        return {
-            'sma_period': {
-                'type': 'int',
-                'default': 15,
-                'min': 5,
-                'max': 200,
-                'description': 'Simple Moving Average period'
-            }
-        }
+        return cls._PARAMS
 
 
 class RSIStrategy(BaseStrategy):
@@ -64,52 +89,67 @@ class RSIStrategy(BaseStrategy):
     
     def _initialize_indicators(self):
         """Initialize RSI indicator"""
-        self.rsi = bt.indicators.RelativeStrengthIndex(
-            self.data.close, period=self.params.rsi_period
-        )
+        self.rsi = FastRSI(self.data.close, period=self.params.rsi_period)
+        # Plain attributes for the thresholds read on every bar
+        self._rsi_lo = self.params.rsi_lower
+        self._rsi_hi = self.params.rsi_upper
+        self._buy_reason_suffix = f" < {self._rsi_lo}"
+        self._sell_reason_suffix = f" > {self._rsi_hi}"
     
     def should_buy(self) -> bool:
         """Buy when RSI is oversold"""
-        return self.rsi[0] < self.params.rsi_lower
+        return self.rsi[0] < self._rsi_lo
     
     def should_sell(self) -> bool:
         """Sell when RSI is overbought"""
-        return self.rsi[0] > self.params.rsi_upper
+        return self.rsi[0] > self._rsi_hi
+    
+    def _precompute_signals(self):
+        """RSI threshold breaches over the whole series"""
+        rsi = line_buffer(self.rsi)
+        return rsi < self._rsi_lo, rsi > self._rsi_hi
+    
+    @classmethod
+    def _vectorized_signals(cls, prices, params):
+        return vectorized_signals.rsi_signals(prices['close'], params['rsi_period'],
+                                              params['rsi_lower'], params['rsi_upper'])
     
     def get_buy_reason(self) -> str:
         """Get reason for buy signal"""
-        return f"RSI oversold: {self.rsi[0]:.1f} < {self.params.rsi_lower}"
+        return f"RSI oversold: {self.rsi[0]:.1f}" + self._buy_reason_suffix
     
     def get_sell_reason(self) -> str:
         """Get reason for sell signal"""
-        return f"RSI overbought: {self.rsi[0]:.1f} > {self.params.rsi_upper}"
+        return f"RSI overbought: {self.rsi[0]:.1f}" + self._sell_reason_suffix
+    
+    _PARAMS = freeze_params({
+        'rsi_period': {
+            'type': 'int',
+            'default': 14,
+            'min': 5,
+            'max': 50,
+            'description': 'RSI calculation period'
+        },
+        'rsi_upper': {
+            'type': 'int',
+            'default': 70,
+            'min': 60,
+            'max': 90,
+            'description': 'RSI overbought threshold'
+        },
+        'rsi_lower': {
+            'type': 'int',
+            'default': 30,
+            'min': 10,
+            'max': 40,
+            'description': 'RSI oversold threshold'
+        }
+    })
     
     @classmethod
-    def get_params(cls) -> Dict[str, Any]:
+    def get_params(cls) -> Mapping[str, Any]:
         """Get strategy parameters for UI"""
-        return {
-            'rsi_period': {
-                'type': 'int',
-                'default': 14,
-                'min': 5,
-                'max': 50,
-                'description': 'RSI calculation period'
-            },
-            'rsi_upper': {
-                'type': 'int',
-                'default': 70,
-                'min': 60,
-                'max': 90,
-                'description': 'RSI overbought threshold'
-            },
-            'rsi_lower': {
-                'type': 'int',
-                'default': 30,
-                'min': 10,
-                'max': 40,
-                'description': 'RSI oversold threshold'
-            }
-        }
+        return cls._PARAMS
 
 
 class MACDStrategy(BaseStrategy):
@@ -130,7 +170,7 @@ class MACDStrategy(BaseStrategy):
             period_me2=self.params.macd_slow,
             period_signal=self.params.macd_signal
         )
-        self.crossover = bt.indicators.CrossOver(self.macd.macd, self.macd.signal)
+        self.crossover = FastCrossOver(self.macd.macd, self.macd.signal)
     
     def should_buy(self) -> bool:
         """Buy when MACD crosses above signal"""
@@ -140,6 +180,16 @@ class MACDStrategy(BaseStrategy):
         """Sell when MACD crosses below signal"""
         return self.crossover[0] < 0
     
+    def _precompute_signals(self):
+        """MACD/signal crossover signs over the whole series"""
+        crossover = line_buffer(self.crossover)
+        return crossover > 0, crossover < 0
+    
+    @classmethod
+    def _vectorized_signals(cls, prices, params):
+        return vectorized_signals.macd_signals(prices['close'], params['macd_fast'],
+                                               params['macd_slow'], params['macd_signal'])
+    
     def get_buy_reason(self) -> str:
         """Get reason for buy signal"""
         return f"MACD bullish crossover: MACD({self.macd.macd[0]:.4f}) > Signal({self.macd.signal[0]:.4f})"
@@ -148,32 +198,34 @@ class MACDStrategy(BaseStrategy):
         """Get reason for sell signal"""
         return f"MACD bearish crossover: MACD({self.macd.macd[0]:.4f}) < Signal({self.macd.signal[0]:.4f})"
     
+    _PARAMS = freeze_params({
+        'macd_fast': {
+            'type': 'int',
+            'default': 12,
+            'min': 5,
+            'max': 50,
+            'description': 'Fast EMA period'
+        },
+        'macd_slow': {
+            'type': 'int',
+            'default': 26,
+            'min': 20,
+            'max': 100,
+            'description': 'Slow EMA period'
+        },
+        'macd_signal': {
+            'type': 'int',
+            'default': 9,
+            'min': 5,
+            'max': 20,
+            'description': 'Signal line period'
+        }
+    })
+    
     @classmethod
-    def get_params(cls) -> Dict[str, Any]:
+    def get_params(cls) -> Mapping[str, Any]:
         """Get strategy parameters for UI"""
-        return {
-            'macd_fast': {
-                'type': 'int',
-                'default': 12,
-                'min': 5,
-                'max': 50,
-                'description': 'Fast EMA period'
-            },
-            'macd_slow': {
-                'type': 'int',
-                'default': 26,
-                'min': 20,
-                'max': 100,
-                'description': 'Slow EMA period'
-            },
-            'macd_signal': {
-                'type': 'int',
-                'default': 9,
-                'min': 5,
-                'max': 20,
-                'description': 'Signal line period'
-            }
-        }
+        return cls._PARAMS
 
 
 class BollingerBandsStrategy(BaseStrategy):
@@ -187,48 +239,73 @@ class BollingerBandsStrategy(BaseStrategy):
     
     def _initialize_indicators(self):
         """Initialize Bollinger Bands"""
-        self.bb = bt.indicators.BollingerBands(
+        self.bb = FastBollingerBands(
             self.data.close,
             period=self.params.bb_period,
             devfactor=self.params.bb_devfactor
         )
+        self._bands_bar = None
+        self._bands_state = None
+    
+    def _bands(self):
+        """(close, bot, top) for the current bar, read once and shared by should_* and reasons"""
+        bar = len(self)
+        if self._bands_bar != bar:
+            self._bands_state = (self.data.close[0], self.bb.lines.bot[0], self.bb.lines.top[0])
+            self._bands_bar = bar
+        return self._bands_state
     
     def should_buy(self) -> bool:
         """Buy when price touches lower band"""
-        return self.data.close[0] <= self.bb.lines.bot[0]
+        close, bot, _ = self._bands()
+        return close <= bot
     
     def should_sell(self) -> bool:
         """Sell when price touches upper band"""
-        return self.data.close[0] >= self.bb.lines.top[0]
+        close, _, top = self._bands()
+        return close >= top
+    
+    def _precompute_signals(self):
+        """Band touches over the whole series"""
+        close = line_buffer(self.data.close)
+        return close <= line_buffer(self.bb.lines.bot), close >= line_buffer(self.bb.lines.top)
+    
+    @classmethod
+    def _vectorized_signals(cls, prices, params):
+        return vectorized_signals.bb_signals(prices['close'], params['bb_period'], params['bb_devfactor'])
     
     def get_buy_reason(self) -> str:
         """Get reason for buy signal"""
-        return f"Price touched lower Bollinger Band: {self.data.close[0]:.2f} <= {self.bb.lines.bot[0]:.2f}"
+        close, bot, _ = self._bands()
+        return f"Price touched lower Bollinger Band: {close:.2f} <= {bot:.2f}"
     
     def get_sell_reason(self) -> str:
         """Get reason for sell signal"""
-        return f"Price touched upper Bollinger Band: {self.data.close[0]:.2f} >= {self.bb.lines.top[0]:.2f}"
+        close, _, top = self._bands()
+        return f"Price touched upper Bollinger Band: {close:.2f} >= {top:.2f}"
+    
+    _PARAMS = freeze_params({
+        'bb_period': {
+            'type': 'int',
+            'default': 20,
+            'min': 10,
+            'max': 50,
+            'description': 'Bollinger Bands period'
+        },
+        'bb_devfactor': {
+            'type': 'float',
+            'default': 2.0,
+            'min': 1.0,
+            'max': 3.0,
+            'step': 0.1,
+            'description': 'Standard deviation factor'
+        }
+    })
     
     @classmethod
-    def get_params(cls) -> Dict[str, Any]:
+    def get_params(cls) -> Mapping[str, Any]:
         """Get strategy parameters for UI"""
-        return {
-            'bb_period': {
-                'type': 'int',
-                'default': 20,
-                'min': 10,
-                'max': 50,
-                'description': 'Bollinger Bands period'
-            },
-            'bb_devfactor': {
-                'type': 'float',
-                'default': 2.0,
-                'min': 1.0,
-                'max': 3.0,
-                'step': 0.1,
-                'description': 'Standard deviation factor'
-            }
-        }
+        return cls._PARAMS
 
 class FibonacciRetracementStrategy(BaseStrategy):
     """Fibonacci Retracement Trading Strategy"""
@@ -240,54 +317,69 @@ class FibonacciRetracementStrategy(BaseStrategy):
 
     def _initialize_indicators(self):
         """Initialize Fibonacci levels"""
-        self.highest = bt.indicators.Highest(self.data.high, period=self.params.lookback)
-        self.lowest = bt.indicators.Lowest(self.data.low, period=self.params.lookback)
-        diff = self.highest - self.lowest
-        self.level382 = self.highest - diff * 0.382
-        self.level618 = self.highest - diff * 0.618
-
-    def _cross_above(self, level) -> bool:
-        return self.data.close[-1] < level[-1] and self.data.close[0] > level[0]
-
-    def _cross_below(self, level) -> bool:
-        return self.data.close[-1] > level[-1] and self.data.close[0] < level[0]
+        levels = FibLevels(self.data.high, self.data.low, period=self.params.lookback)
+        self.level382 = levels.l382
+        self.level618 = levels.l618
+
+        # Strict crosses (previous bar on one side, current bar on the other)
+        # as lines, so backtrader evaluates them in its indicator pass
+        close, prev_close = self.data.close, self.data.close(-1)
+        self.up382 = bt.And(prev_close < self.level382(-1), close > self.level382)
+        self.up618 = bt.And(prev_close < self.level618(-1), close > self.level618)
+        self.down382 = bt.And(prev_close > self.level382(-1), close < self.level382)
+        self.down618 = bt.And(prev_close > self.level618(-1), close < self.level618)
 
     def should_buy(self) -> bool:
         """Buy when price crosses above 38.2% or 61.8% level"""
-        return self._cross_above(self.level382) or self._cross_above(self.level618)
+        return bool(self.up382[0] or self.up618[0])
 
     def should_sell(self) -> bool:
         """Sell when price crosses below 38.2% or 61.8% level"""
-        return self._cross_below(self.level382) or self._cross_below(self.level618)
+        return bool(self.down382[0] or self.down618[0])
+
+    def _precompute_signals(self):
+        """Level crosses over the whole series"""
+        return (np.logical_or(line_buffer(self.up382) > 0, line_buffer(self.up618) > 0),
+                np.logical_or(line_buffer(self.down382) > 0, line_buffer(self.down618) > 0))
+
+    @classmethod
+    def _vectorized_signals(cls, prices, params):
+        return vectorized_signals.fib_signals(prices['high'], prices['low'], prices['close'],
+                                              params['lookback'])
 
     def get_buy_reason(self) -> str:
         """Get reason for buy signal"""
-        if self._cross_above(self.level618):
-            level = 61.8
-        else:
-            level = 38.2
-        return f"Price crossed above Fibonacci {level}% level"
+        if self.up618[0]:
+            return "Price crossed above Fibonacci 61.8% level"
+        return "Price crossed above Fibonacci 38.2% level"
 
     def get_sell_reason(self) -> str:
         """Get reason for sell signal"""
-        if self._cross_below(self.level618):
-            level = 61.8
-        else:
-            level = 38.2
-        return f"Price crossed below Fibonacci {level}% level"
+        if self.down618[0]:
+            return "Price crossed below Fibonacci 61.8% level"
+        return "Price crossed below Fibonacci 38.2% level"
+
+    _PARAMS = freeze_params({
+        'lookback': {
+            'type': 'int',
+            'default': 50,
+            'min': 20,
+            'max': 200,
+            'description': 'Lookback period for Fibonacci levels',
+        }
+    })
 
     @classmethod
-    def get_params(cls) -> Dict[str, Any]:
+    def get_params(cls) -> Mapping[str, Any]:
         """Get strategy parameters for UI"""
-        return {
-            'lookback': {
-                'type': 'int',
-                'default': 50,
-                'min': 20,
-                'max': 200,
-                'description': 'Lookback period for Fibonacci levels',
-            }
-        }
+        return cls._PARAMS
+
+
+class Lot(NamedTuple):
+    """An open SimpleStrategy position lot; orders by target first, so it heaps as-is"""
+    target: float
+    entry: float
+    size: float
 
 
 class SimpleStrategy(BaseStrategy):
@@ -303,17 +395,28 @@ class SimpleStrategy(BaseStrategy):
         ('printlog', True),
     )
 
+    # Price/weighted-average ratio thresholds and the zone for each bracket
+    _ZONE_RATIOS = (0.95, 0.97, 0.99)
+    _ZONES = ('D', 'C', 'B', 'A')
+
     def _initialize_indicators(self):
         """Initialize ATR and weighted average price indicators"""
         self.atr = bt.indicators.ATR(self.data, period=self.params.atr_period)
         weighted_close = (self.data.high + self.data.low + self.data.close * 2) / 4
-        self.weighted_avg = bt.indicators.SimpleMovingAverage(
-            weighted_close, period=self.params.weighted_period
-        )
-
-        self.lots = []  # track individual entry prices and sizes
+        self.weighted_avg = FastSMA(weighted_close, period=self.params.weighted_period)
+        # Low of the last atr_period bars for the zone C bounce check
+        self.lowest_low = bt.indicators.Lowest(self.data.low, period=self.params.atr_period)
+
+        # Open lots as a min-heap of Lot tuples keyed on target price: only the
+        # root needs checking against the current price
+        self.lots = []
+        # Plain attributes for the parameters read on every bar
+        self._pt_mult = 1 + self.params.profit_target_percent / 100
+        self._max_alloc = self.params.max_allocation
+        self._zone_chunks = dict(zip('ABC', self.params.chunk_sizes))
+        self._cooldown_map = {'A': 1, 'B': 3, 'C': 6}  # hours between buys per zone
         self.allocated = 0.0
-        self.last_buy_time = None
+        self.last_buy_secs = None  # bar time in whole seconds (backtrader day number * 86400)
         self.last_buy_zone = None
 
     def should_buy(self) -> bool:  # not used but required
@@ -328,15 +431,122 @@ class SimpleStrategy(BaseStrategy):
     def get_sell_reason(self) -> str:
         return ""
 
+    @classmethod
+    def _vectorized_replay(cls, index, prices, cash, commission, params):
+        """Replay next() bar by bar on NumPy arrays (see BaseStrategy.run_vectorized)
+
+        The zone, cooldown and lot rules depend on earlier fills, so every bar
+        is visited; the indicators are still computed in one pass each.
+        """
+        opens, high, low, close = prices['open'], prices['high'], prices['low'], prices['close']
+        n = len(close)
+        weighted_avg = vectorized_signals.sma((high + low + close * 2) / 4, params['weighted_period'])
+        lowest_low = vectorized_signals.rolling_min(low, params['atr_period'])
+        # First bar next() runs on: ATR needs atr_period + 1 bars
+        first = max(params['weighted_period'], params['atr_period'] + 1) - 1
+        # Bar times in whole seconds, as in next()
+        secs = np.asarray(index.asi8) // 1_000_000_000
+
+        pt_mult = 1 + params['profit_target_percent'] / 100
+        max_alloc = params['max_allocation']
+        zone_chunks = dict(zip('ABC', params['chunk_sizes']))
+        cooldown_map = {'A': 1, 'B': 3, 'C': 6}
+
+        lots = []  # (target, entry, size, lot id), heaped like Lot
+        lot_fills = {}  # lot id -> (fill bar, fill price, commission) of its buy
+        allocated = 0.0
+        last_buy_secs = None
+        last_buy_zone = None
+        position = 0.0
+        pending = []  # (lot id, +size buy / -size sell) orders filling at the next open
+        trades, fills = [], []
+        orders = []  # (bar, side, code into reason_labels) as next() logs them
+        reason_labels = ('Profit target hit',) + tuple(f'Zone {zone} entry' for zone in 'ABC')
+        buy_mask = np.zeros(n, dtype=bool)
+        sell_mask = np.zeros(n, dtype=bool)
+
+        for i in range(first, n):
+            # Fill the previous bar's orders at this bar's open, in submission order
+            for lot_id, size in pending:
+                price = opens[i]
+                value = abs(size) * price
+                comm = value * commission
+                if size > 0:
+                    if value + comm > cash:
+                        continue  # rejected for insufficient cash, as the broker would
+                    cash -= value + comm
+                    lot_fills[lot_id] = (i, price, comm)
+                else:
+                    cash += value - comm
+                    if lot_id in lot_fills:
+                        entry_index, entry_price, entry_comm = lot_fills.pop(lot_id)
+                        trades.append({
+                            'entry_time': index[entry_index],
+                            'entry_price': entry_price,
+                            'exit_time': index[i],
+                            'exit_price': price,
+                            'size': -size,
+                            'pnl': -size * (price - entry_price) - entry_comm - comm
+                        })
+                position += size
+                fills.append({'side': 'buy' if size > 0 else 'sell', 'time': index[i],
+                              'price': price, 'size': size})
+            pending = []
+
+            price = close[i]
+
+            # Sell every open lot whose profit target has been reached
+            released = 0.0
+            while lots and lots[0][0] <= price:
+                _, entry, size, lot_id = heapq.heappop(lots)
+                pending.append((lot_id, -size))
+                orders.append((i, -1, 0))
+                released += entry * size
+                sell_mask[i] = True
+            allocated -= released
+
+            zone = cls._ZONES[bisect.bisect_right(cls._ZONE_RATIOS, price / weighted_avg[i])]
+
+            cooldown = cooldown_map.get(zone, 0)
+            if last_buy_secs is not None and cooldown > 0 and secs[i] - last_buy_secs < cooldown * 3600:
+                continue
+            if last_buy_zone == zone and zone != 'D':
+                continue
+            if zone == 'C' and (price - lowest_low[i]) / lowest_low[i] * 100 < 0.5:
+                continue
+
+            if zone != 'D':
+                trade_value = zone_chunks.get(zone, 0)
+                if 0 < trade_value <= max_alloc - allocated:
+                    size = trade_value / price
+                    lot_id = (i, len(pending))
+                    pending.append((lot_id, size))
+                    orders.append((i, 1, 'ABC'.index(zone) + 1))
+                    heapq.heappush(lots, (price * pt_mult, price, size, lot_id))
+                    allocated += trade_value
+                    buy_mask[i] = True
+
+            last_buy_secs = secs[i]
+            last_buy_zone = zone
+
+        return {
+            'final_value': cash + position * close[-1] if n else cash,
+            'trades': trades,
+            'fills': fills,
+            'buy_signals': buy_mask,
+            'sell_signals': sell_mask,
+            'orders': orders,
+            'reason_labels': reason_labels
+        }
+
     def _pick_chunk_size(self, zone: str) -> float:
-        """Return the appropriate trade chunk based on the current zone"""
-        mapping = {'A': 0, 'B': 1, 'C': 2}
-        idx = mapping.get(zone)
-        if idx is None:
-            return 0
-        remaining = self.params.max_allocation - self.allocated
-        size = self.params.chunk_sizes[idx]
-        return size if size <= remaining else 0
+        """Return the appropriate trade chunk based on the current zone
+
+        Each zone has exactly one chunk size; it is returned only if it still
+        fits under max_allocation (no smaller fallback), otherwise 0.
+        """
+        size = self._zone_chunks.get(zone, 0)
+        return size if size <= self._max_alloc - self.allocated else 0
 
     def next(self):
         if self.order:
@@ -344,36 +554,34 @@ class SimpleStrategy(BaseStrategy):
 
         price = self.data.close[0]
 
-        # Check sell conditions for each open lot
-        for lot in list(self.lots):
-            target = lot['entry'] * (1 + self.params.profit_target_percent / 100)
-            if price >= target:
+        # Sell every open lot whose profit target has been reached
+        lots = self.lots
+        if lots and lots[0].target <= price:
+            released = 0.0
+            while lots and lots[0].target <= price:
+                lot = heapq.heappop(lots)
                 self.log_sell_signal(price, 'Profit target hit')
-                self.log(f'SELL CREATE: Price: {price:.2f}')
-                self.order = self.sell(size=lot['size'])
-                self.lots.remove(lot)
-                self.allocated -= lot['entry'] * lot['size']
+                self.log('SELL CREATE: Price: {:.2f}', price)
+                self.order = self.sell(size=lot.size)
+                released += lot.entry * lot.size
+            self.allocated -= released
 
         avg_price = self.weighted_avg[0]
 
-        # Determine zone based on price vs weighted average
-        if price >= avg_price * 0.99:
-            zone = 'A'
-        elif price >= avg_price * 0.97:
-            zone = 'B'
-        elif price >= avg_price * 0.95:
-            zone = 'C'
-        else:
-            zone = 'D'
+        # Determine zone based on price vs weighted average:
+        # A >= 99%, B >= 97%, C >= 95%, D below
+        zone = self._ZONES[bisect.bisect_right(self._ZONE_RATIOS, price / avg_price)]
 
-        dt = self.datas[0].datetime.datetime(0)
+        # Bar time in whole seconds from backtrader's float day number; rounding
+        # keeps an exact cooldown gap from landing a hair short of the limit
+        now_secs = round(self.datas[0].datetime[0] * 86400)
 
         # Cooldown logic
-        cooldown_map = {'A': 1, 'B': 3, 'C': 6}
-        cooldown = cooldown_map.get(zone, 0)
-        if self.last_buy_time is not None and cooldown > 0:
-            elapsed = (dt - self.last_buy_time).total_seconds() / 3600
-            if elapsed < cooldown:
+        cooldown = self._cooldown_map.get(zone, 0)
+        last_buy_secs = self.last_buy_secs
+        if last_buy_secs is not None and cooldown > 0:
+            elapsed = now_secs - last_buy_secs
+            if elapsed < cooldown * 3600:
                 return
 
         # Avoid multiple buys in same zone
@@ -382,10 +590,7 @@ class SimpleStrategy(BaseStrategy):
 
         # Additional check for zone C bounce
         if zone == 'C':
-            period = self.params.atr_period
-            lookback = min(period, len(self))
-            lows = [self.data.low[-i] for i in range(lookback)]
-            min_low = min(lows)
+            min_low = self.lowest_low[0]
             bounce = (price - min_low) / min_low * 100
             if bounce < 0.5:
                 return
@@ -394,22 +599,17 @@ class SimpleStrategy(BaseStrategy):
             trade_value = self._pick_chunk_size(zone)
             if trade_value > 0:
                 size = trade_value / price
-                self.log_buy_signal(price, f'Zone {zone} entry')
-                self.log(
-                    f'BUY CREATE: Zone {zone} Price: {price:.2f}, Value: {trade_value:.2f}'
-                )
+                if self._signals_enabled:
+                    self.log_buy_signal(price, f'Zone {zone} entry')
+                self.log('BUY CREATE: Zone {} Price: {:.2f}, Value: {:.2f}', zone, price, trade_value)
                 self.order = self.buy(size=size)
-                self.lots.append({'entry': price, 'size': size})
+                heapq.heappush(lots, Lot(price * self._pt_mult, price, size))
                 self.allocated += trade_value
 
 
-        self.last_buy_time = dt
+        self.last_buy_secs = now_secs
         self.last_buy_zone = zone
 
-# Load custom strategies after BaseStrategy definition to avoid circular imports
-from custom_strategies.btc_trader import BTCTraderStrategy
-from custom_strategies.multi_symbol_momentum import MultiSymbolMomentumStrategy
-
 # Strategy registry for easy access
 STRATEGIES = {
     'SMA Crossover': SMAStrategy,
@@ -418,16 +618,46 @@ STRATEGIES = {
     'Fibonacci Retracement': FibonacciRetracementStrategy,
     'Bollinger Bands': BollingerBandsStrategy,
     'Simple': SimpleStrategy,
-    'BTC Trader': BTCTraderStrategy,
-    'Multi-Symbol Momentum': MultiSymbolMomentumStrategy
 }
 
 
-def get_available_strategies() -> Dict[str, type]:
-    """Get all available strategies"""
-    return STRATEGIES
+# Case-insensitive view of the registry for name lookups
+STRATEGIES_LOWER = {name.lower(): cls for name, cls in STRATEGIES.items()}
+
+# Read-only view handed out to callers, so none of them needs a defensive copy
+_STRATEGIES_VIEW = MappingProxyType(STRATEGIES)
+
+
+_BUNDLED_LOADED = False
+
+
+def _load_bundled_strategies() -> None:
+    """Register the strategies shipped in custom_strategies on first use
+
+    Imported lazily so that importing this module does not build them.
+    """
+    global _BUNDLED_LOADED
+    if _BUNDLED_LOADED:
+        return
+
+    from custom_strategies.btc_trader import BTCTraderStrategy
+    from custom_strategies.multi_symbol_momentum import MultiSymbolMomentumStrategy
+
+    for name, cls in (('BTC Trader', BTCTraderStrategy),
+                      ('Multi-Symbol Momentum', MultiSymbolMomentumStrategy)):
+        STRATEGIES[name] = cls
+        STRATEGIES_LOWER[name.lower()] = cls
+    _BUNDLED_LOADED = True
+
+
+def get_available_strategies() -> Mapping[str, type]:
+    """Get all available strategies (read-only)"""
+    _load_bundled_strategies()
+    return _STRATEGIES_VIEW
 
 
+@lru_cache(maxsize=None)
 def get_strategy_class(name: str) -> type:
-    """Get strategy class by name"""
-    return STRATEGIES.get(name)
+    """Get strategy class by name (case-insensitive)"""
+    _load_bundled_strategies()
+    return STRATEGIES.get(name) or STRATEGIES_LOWER.get(name.lower())
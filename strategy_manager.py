@@ -4,90 +4,25 @@ Handles dynamic loading and management of trading strategies
 """
 import os
 import importlib.util
-import inspect
-from typing import Dict, List, Any, Type
-from strategies import BaseStrategy, get_available_strategies
+from collections import ChainMap
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+from typing import Dict, List, Any, Mapping, Type
+from strategies import BaseStrategy, freeze_params, get_available_strategies
 
 
-class StrategyManager:
-    """Manages trading strategies including loading custom strategies"""
-    
-    def __init__(self):
-        self.strategies = get_available_strategies().copy()
-        self.custom_strategies_path = "custom_strategies"
-        
-        # Create custom strategies directory if it doesn't exist
-        if not os.path.exists(self.custom_strategies_path):
-            os.makedirs(self.custom_strategies_path)
-    
-    def load_custom_strategies(self):
-        """Load custom strategies from the custom_strategies directory"""
-        if not os.path.exists(self.custom_strategies_path):
-            return
-        
-        for filename in os.listdir(self.custom_strategies_path):
-            if filename.endswith('.py') and not filename.startswith('__'):
-                filepath = os.path.join(self.custom_strategies_path, filename)
-                self._load_strategy_from_file(filepath)
-    
-    def _load_strategy_from_file(self, filepath: str):
-        """Load a strategy from a Python file"""
-        try:
-            # Load the module
-            spec = importlib.util.spec_from_file_location("custom_strategy", filepath)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            # Find all strategy classes in the module
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
-                    issubclass(obj, BaseStrategy) and 
-                    obj != BaseStrategy):
-                    # Add to strategies
-                    strategy_name = obj.__name__.replace('Strategy', '')
-                    self.strategies[f"Custom: {strategy_name}"] = obj
-                    print(f"Loaded custom strategy: {strategy_name}")
-        
-        except Exception as e:
-            print(f"Error loading strategy from {filepath}: {e}")
-    
-    def get_all_strategies(self) -> Dict[str, Type[BaseStrategy]]:
-        """Get all available strategies including custom ones"""
-        return self.strategies
-    
-    def get_strategy(self, name: str) -> Type[BaseStrategy]:
-        """Get a specific strategy by name"""
-        return self.strategies.get(name)
-    
-    def get_strategy_params(self, name: str) -> Dict[str, Any]:
-        """Get parameters for a specific strategy"""
-        strategy_class = self.get_strategy(name)
-        if strategy_class and hasattr(strategy_class, 'get_params'):
-            return strategy_class.get_params()
-        return {}
-    
-    def validate_strategy(self, strategy_class: Type) -> bool:
-        """Validate that a strategy class is properly implemented"""
-        required_methods = ['_initialize_indicators', 'should_buy', 'should_sell']
-        
-        for method in required_methods:
-            if not hasattr(strategy_class, method):
-                return False
-        
-        return True
-    
-    def create_custom_strategy_template(self, name: str) -> str:
-        """Create a template for a new custom strategy"""
-        template = f'''"""
-Custom Strategy: {name}
+# Source of a new custom strategy file; $name is the strategy's name
+_STRATEGY_TEMPLATE = Template('''"""
+Custom Strategy: $name
 """
 import backtrader as bt
 from strategies import BaseStrategy
 
 
-class {name}Strategy(BaseStrategy):
+class ${name}Strategy(BaseStrategy):
     """
-    Custom {name} trading strategy
+    Custom $name trading strategy
     
     Add your strategy description here
     """
@@ -128,26 +63,121 @@ class {name}Strategy(BaseStrategy):
     @classmethod
     def get_params(cls) -> dict:
         """Define parameter metadata for UI"""
-        return {{
-            'param1': {{
+        return {
+            'param1': {
                 'type': 'int',
                 'default': 10,
                 'min': 1,
                 'max': 100,
                 'description': 'Description for param1'
-            }},
-            'param2': {{
+            },
+            'param2': {
                 'type': 'int',
                 'default': 20,
                 'min': 1,
                 'max': 200,
                 'description': 'Description for param2'
-            }}
-        }}
-'''
+            }
+        }
+''')
+
+# Methods every strategy class must override (checked by validate_strategy)
+_REQUIRED_METHODS = ('_initialize_indicators', 'should_buy', 'should_sell')
+
+
+@lru_cache(maxsize=128)
+def _frozen_params(strategy_class: Type) -> Mapping[str, Mapping[str, Any]]:
+    """get_params() of a strategy class, built once and shared read-only"""
+    return freeze_params(strategy_class.get_params())
+
+
+class StrategyManager:
+    """Manages trading strategies including loading custom strategies"""
+    
+    def __init__(self):
+        # Custom strategies layered over the shared built-in registry; writes
+        # land in _custom, so the registry itself is never copied or modified
+        self._custom = {}
+        self.strategies = ChainMap(self._custom, get_available_strategies())
+        self.custom_strategies_path = "custom_strategies"
+        # Executed custom-strategy modules: path -> (mtime_ns, module)
+        self._module_cache = {}
+        
+        # Create custom strategies directory if it doesn't exist
+        if not os.path.exists(self.custom_strategies_path):
+            os.makedirs(self.custom_strategies_path)
+    
+    def load_custom_strategies(self):
+        """Load custom strategies from the custom_strategies directory"""
+        if not os.path.exists(self.custom_strategies_path):
+            return
+        
+        with os.scandir(self.custom_strategies_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.py') and not entry.name.startswith('__') and entry.is_file():
+                    self._load_strategy_from_file(entry.path)
+    
+    def _load_strategy_from_file(self, filepath: str):
+        """Load a strategy from a Python file"""
+        try:
+            # Load the module, reusing the previous load if the file is unchanged
+            mtime = os.stat(filepath).st_mtime_ns
+            cached = self._module_cache.get(filepath)
+            if cached is not None and cached[0] == mtime:
+                module = cached[1]
+            else:
+                spec = importlib.util.spec_from_file_location("custom_strategy", filepath)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                self._module_cache[filepath] = (mtime, module)
+            
+            # Find all strategy classes in the module
+            for name, obj in vars(module).items():
+                if (isinstance(obj, type) and 
+                    obj is not BaseStrategy and 
+                    issubclass(obj, BaseStrategy)):
+                    # Add to strategies
+                    strategy_name = obj.__name__.replace('Strategy', '')
+                    self.strategies[f"Custom: {strategy_name}"] = obj
+                    print(f"Loaded custom strategy: {strategy_name}")
+        
+        except Exception as e:
+            print(f"Error loading strategy from {filepath}: {e}")
+    
+    def get_all_strategies(self) -> Mapping[str, Type[BaseStrategy]]:
+        """Get all available strategies including custom ones"""
+        return self.strategies
+    
+    def get_strategy(self, name: str) -> Type[BaseStrategy]:
+        """Get a specific strategy by name"""
+        return self.strategies.get(name)
+    
+    def get_strategy_params(self, name: str) -> Mapping[str, Any]:
+        """Get parameters for a specific strategy (read-only; copy with dict() to modify)"""
+        strategy_class = self.get_strategy(name)
+        if strategy_class and hasattr(strategy_class, 'get_params'):
+            return _frozen_params(strategy_class)
+        return {}
+    
+    def validate_strategy(self, strategy_class: Type) -> bool:
+        """Validate that a strategy class is properly implemented
+
+        Every required method must be overridden: BaseStrategy's own versions
+        are abstract placeholders.
+        """
+        if not (isinstance(strategy_class, type) and issubclass(strategy_class, BaseStrategy)):
+            return False
+        for method in _REQUIRED_METHODS:
+            if getattr(strategy_class, method, None) is getattr(BaseStrategy, method):
+                return False
+        
+        return True
+    
+    def create_custom_strategy_template(self, name: str) -> str:
+        """Create a template for a new custom strategy"""
+        template = _STRATEGY_TEMPLATE.substitute(name=name)
         
         filename = f"{self.custom_strategies_path}/{name.lower()}_strategy.py"
-        with open(filename, 'w') as f:
-            f.write(template)
+        Path(filename).write_text(template)
         
         return filename
\ No newline at end of file
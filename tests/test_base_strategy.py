@@ -0,0 +1,43 @@
+"""
+Tests for BaseStrategy
+"""
+import backtrader as bt
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategies import SMAStrategy
+
+CASH = 10000.0
+
+
+def _first_buy(sizer=None, **sizer_kwargs):
+    close = 100 + 5 * np.sin(np.linspace(0, 12, 200))
+    index = pd.date_range('2024-01-01', periods=len(close), freq='5min')
+    frame = pd.DataFrame({'open': close, 'high': close, 'low': close,
+                          'close': close, 'volume': 1000.0}, index=index)
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(bt.feeds.PandasData(dataname=frame))
+    cerebro.addstrategy(SMAStrategy, printlog=False)
+    cerebro.broker.set_cash(CASH)
+    if sizer is not None:
+        cerebro.addsizer(sizer, **sizer_kwargs)
+    log = cerebro.run()[0].execution_log
+    buys = log[log['side'] > 0]
+    assert len(buys) > 0
+    return buys[0]
+
+
+def test_default_sizing_is_95_percent_of_cash():
+    buy = _first_buy()
+    assert buy['size'] * buy['price'] == pytest.approx(CASH * 0.95, rel=0.01)
+
+
+def test_explicit_fixed_size_sizer_is_kept():
+    buy = _first_buy(bt.sizers.FixedSize, stake=3)
+    assert buy['size'] == 3
+
+
+def test_explicit_percent_sizer_is_kept():
+    buy = _first_buy(bt.sizers.PercentSizer, percents=50)
+    assert buy['size'] * buy['price'] == pytest.approx(CASH * 0.5, rel=0.01)
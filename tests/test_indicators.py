@@ -0,0 +1,147 @@
+"""
+Parity tests: the NumPy-backed indicators against the backtrader indicators they replace
+"""
+import backtrader as bt
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import FastBollingerBands, FastCrossOver, FastRSI, FastSMA, FibLevels
+
+RUN_MODES = pytest.mark.parametrize('runonce', [True, False], ids=['runonce', 'runnext'])
+
+
+def _feed(n: int = 300, seed: int = 7) -> bt.feeds.PandasData:
+    """Random-walk 5m bars with a flat stretch (zero moves, SMA touches) in the middle"""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    close[120:140] = close[119]
+    close = np.round(close, 2)
+    high = close + np.round(rng.uniform(0, 0.8, n), 2)
+    low = close - np.round(rng.uniform(0, 0.8, n), 2)
+    index = pd.date_range('2024-01-01', periods=n, freq='5min')
+    frame = pd.DataFrame({'open': close, 'high': high, 'low': low,
+                          'close': close, 'volume': 1000.0}, index=index)
+    return bt.feeds.PandasData(dataname=frame)
+
+
+def _run(build, runonce: bool, feed=None):
+    """Run a strategy whose __init__ calls build(strategy) and return that strategy"""
+    class Harness(bt.Strategy):
+        def __init__(self):
+            self.pairs = build(self)
+
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(feed if feed is not None else _feed())
+    cerebro.addstrategy(Harness)
+    return cerebro.run(runonce=runonce)[0]
+
+
+def _assert_same(fast_line, reference_line, **tolerance):
+    fast = np.asarray(fast_line.array, dtype=np.float64)
+    reference = np.asarray(reference_line.array, dtype=np.float64)
+    assert len(fast) == len(reference)
+    assert np.count_nonzero(~np.isnan(reference)) > len(reference) // 2
+    np.testing.assert_allclose(fast, reference, equal_nan=True, **tolerance)
+
+
+@RUN_MODES
+@pytest.mark.parametrize('period', [1, 5, 30])
+def test_fast_sma_matches_sma(runonce, period):
+    def build(strategy):
+        return (FastSMA(strategy.data.close, period=period),
+                bt.indicators.SMA(strategy.data.close, period=period))
+
+    fast, reference = _run(build, runonce).pairs
+    assert fast._minperiod == reference._minperiod
+    _assert_same(fast.lines.sma, reference.lines.sma, rtol=1e-12)
+
+
+@RUN_MODES
+def test_fast_crossover_matches_crossover(runonce):
+    def build(strategy):
+        close = strategy.data.close
+        sma = bt.indicators.SMA(close, period=10)
+        return FastCrossOver(close, sma), bt.indicators.CrossOver(close, sma)
+
+    fast, reference = _run(build, runonce).pairs
+    assert fast._minperiod == reference._minperiod
+    _assert_same(fast.lines.crossover, reference.lines.crossover)
+    assert np.nansum(np.abs(np.asarray(fast.lines.crossover.array))) > 0
+
+
+@RUN_MODES
+@pytest.mark.parametrize('period', [2, 14])
+def test_fast_rsi_matches_rsi(runonce, period):
+    def build(strategy):
+        close = strategy.data.close
+        return (FastRSI(close, period=period),
+                bt.indicators.RSI(close, period=period, safediv=True))
+
+    fast, reference = _run(build, runonce).pairs
+    assert fast._minperiod == reference._minperiod
+    _assert_same(fast.lines.rsi, reference.lines.rsi, rtol=1e-9)
+
+
+@RUN_MODES
+def test_fast_rsi_handles_zero_loss_and_flat_windows(runonce):
+    # Only rising bars first (no losses), then a flat run (no moves at all)
+    close = np.concatenate([np.linspace(100, 110, 30), np.full(30, 110.0), np.linspace(110, 105, 20)])
+    index = pd.date_range('2024-01-01', periods=len(close), freq='5min')
+    frame = pd.DataFrame({'open': close, 'high': close, 'low': close,
+                          'close': close, 'volume': 1000.0}, index=index)
+
+    def build(strategy):
+        return (FastRSI(strategy.data.close, period=5),
+                bt.indicators.RSI(strategy.data.close, period=5, safediv=True))
+
+    fast, reference = _run(build, runonce, bt.feeds.PandasData(dataname=frame)).pairs
+    _assert_same(fast.lines.rsi, reference.lines.rsi, rtol=1e-9)
+
+
+@RUN_MODES
+def test_fast_rsi_is_neutral_without_any_moves(runonce):
+    # The seed window has no gains and no losses at all
+    close = np.concatenate([np.full(10, 100.0), np.linspace(100, 104, 10)])
+    index = pd.date_range('2024-01-01', periods=len(close), freq='5min')
+    frame = pd.DataFrame({'open': close, 'high': close, 'low': close,
+                          'close': close, 'volume': 1000.0}, index=index)
+
+    def build(strategy):
+        return (FastRSI(strategy.data.close, period=5),
+                bt.indicators.RSI(strategy.data.close, period=5, safediv=True))
+
+    fast, reference = _run(build, runonce, bt.feeds.PandasData(dataname=frame)).pairs
+    assert fast.lines.rsi.array[5] == 50.0
+    _assert_same(fast.lines.rsi, reference.lines.rsi, rtol=1e-9)
+
+
+@RUN_MODES
+@pytest.mark.parametrize('period,devfactor', [(20, 2.0), (5, 1.5)])
+def test_fast_bollinger_bands_match_bollinger_bands(runonce, period, devfactor):
+    def build(strategy):
+        close = strategy.data.close
+        return (FastBollingerBands(close, period=period, devfactor=devfactor),
+                bt.indicators.BollingerBands(close, period=period, devfactor=devfactor))
+
+    fast, reference = _run(build, runonce).pairs
+    assert fast._minperiod == reference._minperiod
+    for name in ('mid', 'top', 'bot'):
+        _assert_same(getattr(fast.lines, name), getattr(reference.lines, name), rtol=0, atol=1e-6)
+
+
+@RUN_MODES
+@pytest.mark.parametrize('period', [1, 50])
+def test_fib_levels_match_highest_lowest(runonce, period):
+    def build(strategy):
+        data = strategy.data
+        highest = bt.indicators.Highest(data.high, period=period)
+        lowest = bt.indicators.Lowest(data.low, period=period)
+        diff = highest - lowest
+        return FibLevels(data.high, data.low, period=period), (highest - diff * 0.382,
+                                                               highest - diff * 0.618)
+
+    fast, (l382, l618) = _run(build, runonce).pairs
+    assert fast._minperiod == l382._minperiod
+    _assert_same(fast.lines.l382, l382, rtol=1e-12)
+    _assert_same(fast.lines.l618, l618, rtol=1e-12)
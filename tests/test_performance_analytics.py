@@ -0,0 +1,26 @@
+"""
+Tests for PerformanceAnalyzer
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from performance_analytics import PerformanceAnalyzer
+
+
+def _reference_capture(strategy: pd.Series, benchmark: pd.Series, up: bool) -> float:
+    mask = benchmark > 0 if up else benchmark < 0
+    strategy_avg = strategy[mask].mean()
+    benchmark_avg = benchmark[mask].mean()
+    return (strategy_avg / benchmark_avg) * 100
+
+
+def test_capture_ratios_skip_nan_strategy_returns():
+    benchmark = pd.Series([0.01, -0.02, 0.03, -0.01, 0.02, 0.0])
+    strategy = pd.Series([0.02, np.nan, np.nan, -0.005, 0.01, 0.01])
+
+    up, down = PerformanceAnalyzer()._calculate_capture_ratios(strategy, benchmark)
+
+    assert not np.isnan(up) and not np.isnan(down)
+    assert up == pytest.approx(_reference_capture(strategy, benchmark, up=True))
+    assert down == pytest.approx(_reference_capture(strategy, benchmark, up=False))
@@ -0,0 +1,45 @@
+"""
+Tests for ReportGenerator
+"""
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+import report_generator
+from report_generator import ReportGenerator
+
+orjson = pytest.importorskip('orjson')
+
+
+def _generator_with(report):
+    generator = ReportGenerator(cerebro=None, results=[], config={})
+    generator._report_cache = report
+    return generator
+
+
+def test_save_report_is_identical_with_and_without_orjson(tmp_path, monkeypatch):
+    report = {
+        'generated_at': datetime(2024, 3, 1, 12, 30).isoformat(),
+        'configuration': {'symbol': 'BTC-USD', 'start': datetime(2024, 3, 1), 'initial_capital': 10000},
+        'metrics': {
+            'basic_performance': {'total_return': 12.345, 'final_value': np.float64(11234.5)},
+            'risk': {'sharpe_ratio': float('nan'), 'sortino_ratio': float('inf'), 'max_drawdown': -3.2},
+            'trades': {'total_trades': np.int64(14), 'win_rate': 57.14285714285714},
+            'series': np.array([0.5, np.nan, 1.25]),
+            'by_period': {1: 0.1, 2: -0.25},
+            'empty': {},
+        },
+        'ai_insights': '✅ The strategy generated a positive return of 12.35%\n⚠️ High drawdown',
+        'recommendations': ['📈 Consider a trailing stop', 'Größe reduzieren'],
+    }
+    generator = _generator_with(report)
+
+    fast_path = tmp_path / 'orjson.json'
+    generator.save_report(str(fast_path))
+    monkeypatch.setattr(report_generator, 'orjson', None)
+    stdlib_path = tmp_path / 'stdlib.json'
+    generator.save_report(str(stdlib_path))
+
+    assert fast_path.read_bytes() == stdlib_path.read_bytes()
+    assert '✅' in stdlib_path.read_text(encoding='utf-8')
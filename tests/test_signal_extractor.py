@@ -0,0 +1,152 @@
+"""
+Tests for signal_extractor helpers
+"""
+import datetime
+import json
+import sys
+import types
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+import pytest
+
+import signal_extractor
+from signal_extractor import SignalExtractor, bt_nums_to_datetimes
+
+
+@pytest.fixture(autouse=True)
+def custom_strategy_module(monkeypatch):
+    """Stand-in for the module strategy_manager loads custom strategies as
+
+    backtrader's metaclass looks a new class's module up in sys.modules.
+    """
+    monkeypatch.setitem(sys.modules, 'custom_strategy', types.ModuleType('custom_strategy'))
+
+
+def _make_strategy_class():
+    """A fresh class object with the same module and qualname on every call"""
+    class ReloadedStrategy(bt.Strategy):
+        params = (('period', 5),)
+
+        def next(self):
+            if not self.position:
+                self.buy()
+            elif len(self) % 7 == 0:
+                self.close()
+
+    ReloadedStrategy.__module__ = 'custom_strategy'
+    return ReloadedStrategy
+
+
+def _run(strategy_class, closes, highs=None, sizer=None):
+    index = pd.date_range('2024-01-01', periods=len(closes), freq='5min')
+    frame = pd.DataFrame({'open': closes, 'high': closes if highs is None else highs,
+                          'low': closes, 'close': closes, 'volume': 1000.0}, index=index)
+    cerebro = bt.Cerebro()
+    cerebro.adddata(bt.feeds.PandasData(dataname=frame))
+    if sizer is not None:
+        cerebro.addsizer(*sizer)
+    cerebro.addstrategy(strategy_class)
+    cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
+    return cerebro, cerebro.run()
+
+
+def test_bt_nums_to_datetimes_matches_num2date_intraday():
+    start = datetime.datetime(2024, 3, 1)
+    stamps = [start + datetime.timedelta(minutes=5 * i) for i in range(2000)]
+    nums = np.array([bt.date2num(ts) for ts in stamps])
+
+    converted = bt_nums_to_datetimes(nums)
+
+    expected = [bt.num2date(num) for num in nums]
+    assert list(converted.to_pydatetime()) == expected
+    assert list(converted.to_pydatetime()) == stamps
+
+
+def test_extraction_cache_misses_for_reloaded_class_with_same_name():
+    signal_extractor._EXTRACTION_CACHE.clear()
+    closes = np.linspace(100.0, 130.0, 60)
+    first = _make_strategy_class()
+    second = _make_strategy_class()
+    assert first.__qualname__ == second.__qualname__ and first is not second
+
+    cerebro, results = _run(first, closes)
+    SignalExtractor().extract_from_backtest(cerebro, results)
+    assert len(signal_extractor._EXTRACTION_CACHE) == 1
+
+    cerebro, results = _run(second, closes)
+    key = signal_extractor._extraction_key(cerebro, results[0])
+    assert key not in signal_extractor._EXTRACTION_CACHE
+    SignalExtractor().extract_from_backtest(cerebro, results)
+    assert len(signal_extractor._EXTRACTION_CACHE) == 2
+
+
+def test_extraction_key_covers_the_middle_of_the_data():
+    strategy_class = _make_strategy_class()
+    closes = np.linspace(100.0, 130.0, 60)
+    edited = closes.copy()
+    edited[30] += 1.0
+
+    keys = [signal_extractor._extraction_key(*_with_strategy(_run(strategy_class, c)))
+            for c in (closes, edited)]
+    assert None not in keys and keys[0] != keys[1]
+
+
+def test_extraction_key_covers_other_lines_and_sizer():
+    strategy_class = _make_strategy_class()
+    closes = np.linspace(100.0, 130.0, 60)
+
+    base = signal_extractor._extraction_key(*_with_strategy(_run(strategy_class, closes)))
+    other_high = signal_extractor._extraction_key(
+        *_with_strategy(_run(strategy_class, closes, highs=closes + 1.0)))
+    other_sizer = signal_extractor._extraction_key(
+        *_with_strategy(_run(strategy_class, closes, sizer=(bt.sizers.PercentSizer,))))
+
+    assert base != other_high
+    assert base != other_sizer
+
+
+def test_extraction_cache_hit_returns_a_copy():
+    signal_extractor._EXTRACTION_CACHE.clear()
+    strategy_class = _make_strategy_class()
+    cerebro, results = _run(strategy_class, np.linspace(100.0, 130.0, 60))
+
+    first = SignalExtractor().extract_from_backtest(cerebro, results)
+    first['trades'].append({'direction': 'bogus'})
+
+    second = SignalExtractor().extract_from_backtest(cerebro, results)
+    assert {'direction': 'bogus'} not in second['trades']
+
+
+def _with_strategy(run):
+    cerebro, results = run
+    return cerebro, results[0]
+
+
+def test_close_buffer_leaves_line_array_resizable_and_follows_reruns():
+    closes = np.linspace(100.0, 130.0, 60)
+    cerebro, _ = _run(_make_strategy_class(), closes)
+
+    prices = signal_extractor.close_buffer(cerebro)
+    np.testing.assert_array_equal(prices, closes)
+    # A zero-copy view would make this raise BufferError
+    cerebro.datas[0].close.array.append(0.0)
+
+    assert signal_extractor.close_buffer(cerebro) is not prices
+    cerebro.run()
+    np.testing.assert_array_equal(signal_extractor.close_buffer(cerebro), closes)
+
+
+def test_signals_to_dict_is_json_friendly():
+    signals = SignalExtractor._empty_signals()
+    signals['buy_signals'].append(pd.Timestamp('2024-01-01 00:05'), 101.5, 'entry')
+    signals['sell_signals'].append(pd.Timestamp('2024-01-01 01:00'), 103.0, 'exit')
+
+    exported = SignalExtractor.signals_to_dict(signals)
+
+    assert exported['buy_signals'] == {
+        'timestamp': [pd.Timestamp('2024-01-01 00:05')], 'price': [101.5], 'reason': ['entry']}
+    assert exported['sell_signals']['price'] == [103.0]
+    decoded = json.loads(json.dumps(exported, default=str))
+    assert decoded['buy_signals']['timestamp'] == ['2024-01-01 00:05:00']
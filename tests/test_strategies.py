@@ -0,0 +1,39 @@
+"""
+Tests for the built-in strategies
+"""
+import datetime
+
+import backtrader as bt
+import pandas as pd
+
+from strategies import SimpleStrategy
+
+BAR = datetime.timedelta(minutes=5)
+
+
+def _buy_times(start: datetime.datetime, closes):
+    index = pd.date_range(start, periods=len(closes), freq=BAR)
+    frame = pd.DataFrame({'open': closes, 'high': closes, 'low': closes,
+                          'close': closes, 'volume': 1000.0}, index=index)
+    cerebro = bt.Cerebro()
+    cerebro.broker.set_cash(100000)
+    cerebro.adddata(bt.feeds.PandasData(dataname=frame))
+    cerebro.addstrategy(SimpleStrategy, printlog=False)
+    strategy = cerebro.run()[0]
+    return [signal['timestamp'] for signal in strategy.get_signals() if signal['type'] == 'buy']
+
+
+def test_simple_strategy_buys_when_gap_equals_cooldown_on_5m_bars():
+    # Flat warm-up (zone A), one zone D bar, then back in zone A: the zone A
+    # cooldown is 1h after the zone D bar, i.e. exactly 12 five-minute bars
+    dip = 30
+    closes = [100.0] * dip + [90.0] + [100.0] * 20
+
+    day = datetime.datetime(2024, 3, 4)
+    for offset in range(0, 24 * 60, 5):
+        start = day + datetime.timedelta(minutes=offset)
+        buys = _buy_times(start, closes)
+
+        expected = start + (dip + 12) * BAR
+        assert len(buys) == 2, start
+        assert abs(buys[1] - expected) < datetime.timedelta(seconds=1), start
@@ -0,0 +1,44 @@
+"""
+Tests for StrategyManager
+"""
+import pytest
+
+from strategies import BaseStrategy, get_available_strategies
+from strategy_manager import StrategyManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    # StrategyManager creates its custom_strategies directory relative to the cwd
+    monkeypatch.chdir(tmp_path)
+    return StrategyManager()
+
+
+@pytest.mark.parametrize('name', sorted(get_available_strategies()))
+def test_registered_strategies_validate(manager, name):
+    assert manager.validate_strategy(get_available_strategies()[name])
+
+
+def test_validate_strategy_requires_overridden_signal_methods(manager):
+    class NoSignals(BaseStrategy):
+        def _initialize_indicators(self):
+            pass
+
+        def get_buy_reason(self) -> str:
+            return ""
+
+        def get_sell_reason(self) -> str:
+            return ""
+
+    class BuyOnly(NoSignals):
+        def should_buy(self) -> bool:
+            return True
+
+    class Complete(BuyOnly):
+        def should_sell(self) -> bool:
+            return False
+
+    assert not manager.validate_strategy(NoSignals)
+    assert not manager.validate_strategy(BuyOnly)
+    assert manager.validate_strategy(Complete)
+    assert not manager.validate_strategy(object)
@@ -0,0 +1,95 @@
+"""
+Parity tests: BaseStrategy.run_vectorized against a cerebro run of the same strategy
+"""
+import backtrader as bt
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategies import (BollingerBandsStrategy, FibonacciRetracementStrategy, MACDStrategy,
+                        RSIStrategy, SMAStrategy, SimpleStrategy)
+
+CASH = 10000.0
+STRATEGIES = [SMAStrategy, RSIStrategy, MACDStrategy, BollingerBandsStrategy,
+              FibonacciRetracementStrategy, SimpleStrategy]
+
+
+@pytest.fixture(scope='module')
+def ohlc() -> pd.DataFrame:
+    """2000 five-minute bars of a seeded geometric random walk, in data_fetcher's column layout"""
+    rng = np.random.default_rng(5)
+    n = 2000
+    close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.004, n))), 2)
+    opens = np.round(close * (1 + rng.normal(0, 0.001, n)), 2)
+    high = np.maximum(opens, close) + np.round(rng.uniform(0, 0.3, n), 2)
+    low = np.minimum(opens, close) - np.round(rng.uniform(0, 0.3, n), 2)
+    return pd.DataFrame({'Open': opens, 'High': high, 'Low': low, 'Close': close, 'Volume': 1000.0},
+                        index=pd.date_range('2024-01-01', periods=n, freq='5min'))
+
+
+def _cerebro_run(strategy_class, df: pd.DataFrame, commission: float, runonce: bool):
+    """Run the strategy the way main.run_backtest sets cerebro up"""
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(bt.feeds.PandasData(dataname=df))
+    cerebro.addstrategy(strategy_class, printlog=False)
+    cerebro.broker.set_cash(CASH)
+    cerebro.broker.setcommission(commission=commission)
+    cerebro.addsizer(bt.sizers.PercentSizer, percents=95)
+    cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
+    strategy = cerebro.run(runonce=runonce)[0]
+    return cerebro.broker.getvalue(), strategy
+
+
+@pytest.mark.parametrize('runonce', [True, False], ids=['runonce', 'runnext'])
+@pytest.mark.parametrize('commission', [0.0, 0.001])
+@pytest.mark.parametrize('strategy_class', STRATEGIES, ids=lambda cls: cls.__name__)
+def test_run_vectorized_matches_cerebro(ohlc, strategy_class, commission, runonce):
+    final_value, strategy = _cerebro_run(strategy_class, ohlc, commission, runonce)
+    result = strategy_class.run_vectorized(ohlc, cash=CASH, commission=commission)
+
+    assert result['final_value'] == pytest.approx(final_value, rel=1e-10)
+
+    log = strategy.execution_log
+    fills = result['fills']
+    assert len(log) > 10
+    assert len(fills) == len(log)
+    assert [fill['time'] for fill in fills] == list(pd.DatetimeIndex(log['datetime']))
+    np.testing.assert_allclose([fill['price'] for fill in fills], log['price'], rtol=1e-12)
+    np.testing.assert_allclose([fill['size'] for fill in fills], log['size'], rtol=1e-12)
+    assert [fill['side'] == 'buy' for fill in fills] == list(log['side'] > 0)
+
+
+@pytest.mark.parametrize('strategy_class', STRATEGIES[:-1], ids=lambda cls: cls.__name__)
+def test_run_vectorized_trades_match_trade_analyzer(ohlc, strategy_class):
+    _, strategy = _cerebro_run(strategy_class, ohlc, 0.001, True)
+    trades = strategy_class.run_vectorized(ohlc, cash=CASH, commission=0.001)['trades']
+
+    analysis = strategy.analyzers.trades.get_analysis()
+    assert len(trades) == analysis.total.closed
+    assert sum(trade['pnl'] for trade in trades) == pytest.approx(analysis.pnl.net.total, rel=1e-9)
+
+
+def test_simple_strategy_lot_trades_cover_every_closed_lot(ohlc):
+    result = SimpleStrategy.run_vectorized(ohlc, cash=CASH, commission=0.001)
+
+    sells = [fill for fill in result['fills'] if fill['side'] == 'sell']
+    assert len(result['trades']) == len(sells) > 0
+    for trade in result['trades']:
+        assert trade['size'] > 0
+        assert trade['exit_time'] > trade['entry_time']
+
+
+@pytest.mark.parametrize('strategy_class', STRATEGIES, ids=lambda cls: cls.__name__)
+def test_run_vectorized_signal_log_matches_cerebro(ohlc, strategy_class):
+    _, strategy = _cerebro_run(strategy_class, ohlc, 0.001, True)
+    signals = strategy_class.run_vectorized(ohlc, cash=CASH, commission=0.001)['signals']
+
+    expected = strategy.get_signals()
+    assert len(signals) == len(expected) > 0
+    assert [s['type'] for s in signals] == [s['type'] for s in expected]
+    assert [s['timestamp'] for s in signals] == [s['timestamp'] for s in expected]
+    np.testing.assert_allclose([s['price'] for s in signals], [s['price'] for s in expected])
+    if strategy_class is SimpleStrategy:
+        assert [s['reason'] for s in signals] == [s['reason'] for s in expected]
+    else:
+        assert {s['reason'] for s in signals} <= {'Buy signal', 'Sell signal'}
@@ -0,0 +1,158 @@
+"""
+Vectorized Signals Module
+Full-series NumPy versions of the built-in strategies' indicators and signal
+rules, usable without running a backtrader loop
+"""
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+Masks = Tuple[np.ndarray, np.ndarray]
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average, NaN until the first full window"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1:] = np.lib.stride_tricks.sliding_window_view(values, period).mean(axis=1)
+    return out
+
+
+def _seeded_smoothing(values: np.ndarray, period: int, alpha: float) -> np.ndarray:
+    """Exponential smoothing seeded with the SMA of the first full window
+
+    Matches backtrader's EMA/SMMA warm-up. Leading NaNs (e.g. from an input
+    that is itself an indicator) are skipped before seeding.
+    """
+    out = np.full(len(values), np.nan)
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) == 0 or valid[0] + period > len(values):
+        return out
+
+    first = valid[0]
+    seed_at = first + period - 1
+    seg = values[seed_at:].copy()
+    seg[0] = values[first:seed_at + 1].mean()
+    out[seed_at:] = pd.Series(seg).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    return out
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average (alpha = 2 / (period + 1))"""
+    return _seeded_smoothing(values, period, 2.0 / (period + 1))
+
+
+def rsi(close: np.ndarray, period: int) -> np.ndarray:
+    """Relative Strength Index with Wilder smoothing
+
+    Zero average loss gives 100, or 50 when there are no moves at all, as
+    ``bt.indicators.RSI`` does with ``safediv=True``.
+    """
+    delta = np.diff(close, prepend=np.nan)
+    up = np.where(delta > 0, delta, 0.0)
+    down = np.where(delta < 0, -delta, 0.0)
+    up[:1] = down[:1] = np.nan
+
+    avg_up = _seeded_smoothing(up, period, 1.0 / period)
+    avg_down = _seeded_smoothing(down, period, 1.0 / period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = 100.0 - 100.0 / (1.0 + avg_up / avg_down)
+    values[(avg_down == 0) & (avg_up == 0)] = 50.0
+    return values
+
+
+def bollinger_bands(close: np.ndarray, period: int, devfactor: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(mid, top, bot) bands using the population standard deviation"""
+    mid = sma(close, period)
+    std = np.full(len(close), np.nan)
+    if len(close) >= period:
+        std[period - 1:] = np.lib.stride_tricks.sliding_window_view(close, period).std(axis=1)
+    return mid, mid + devfactor * std, mid - devfactor * std
+
+
+def rolling_max(values: np.ndarray, period: int) -> np.ndarray:
+    """Highest value over the last period bars, NaN until the first full window"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1:] = np.lib.stride_tricks.sliding_window_view(values, period).max(axis=1)
+    return out
+
+
+def rolling_min(values: np.ndarray, period: int) -> np.ndarray:
+    """Lowest value over the last period bars, NaN until the first full window"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1:] = np.lib.stride_tricks.sliding_window_view(values, period).min(axis=1)
+    return out
+
+
+def fib_levels(high: np.ndarray, low: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(38.2%, 61.8%) retracement levels of the rolling high/low range"""
+    highest = rolling_max(high, period)
+    diff = highest - rolling_min(low, period)
+    return highest - diff * 0.382, highest - diff * 0.618
+
+
+def crossover(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """+1 where a crosses above b, -1 where it crosses below, 0 otherwise
+
+    Crosses are judged against the last non-zero difference, as in
+    ``bt.indicators.CrossOver``.
+    """
+    diff = a - b
+    out = np.zeros(len(diff))
+    valid = np.flatnonzero(~np.isnan(diff))
+    if len(valid) == 0:
+        return out
+
+    seg = diff[valid[0]:]
+    keep = seg != 0
+    keep[0] = True
+    nzd = seg[np.maximum.accumulate(np.where(keep, np.arange(len(seg)), 0))]
+
+    prev, cur = nzd[:-1], seg[1:]
+    out[valid[0] + 1:] = ((prev < 0) & (cur > 0)).astype(np.float64) - ((prev > 0) & (cur < 0))
+    return out
+
+
+def sma_cross_signals(close: np.ndarray, period: int) -> Masks:
+    """Buy/sell masks for SMAStrategy: close crossing its SMA"""
+    cross = crossover(close, sma(close, period))
+    return cross > 0, cross < 0
+
+
+def rsi_signals(close: np.ndarray, period: int, lower: float, upper: float) -> Masks:
+    """Buy/sell masks for RSIStrategy: RSI below lower / above upper"""
+    values = rsi(close, period)
+    return values < lower, values > upper
+
+
+def macd_signals(close: np.ndarray, fast: int, slow: int, signal: int) -> Masks:
+    """Buy/sell masks for MACDStrategy: MACD crossing its signal line"""
+    macd = ema(close, fast) - ema(close, slow)
+    cross = crossover(macd, ema(macd, signal))
+    return cross > 0, cross < 0
+
+
+def _strict_crosses(close: np.ndarray, level: np.ndarray) -> Masks:
+    """(up, down) masks: previous close on one side of the previous level, current close on the other"""
+    up = np.zeros(len(close), dtype=bool)
+    down = np.zeros(len(close), dtype=bool)
+    up[1:] = (close[:-1] < level[:-1]) & (close[1:] > level[1:])
+    down[1:] = (close[:-1] > level[:-1]) & (close[1:] < level[1:])
+    return up, down
+
+
+def fib_signals(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> Masks:
+    """Buy/sell masks for FibonacciRetracementStrategy: close crossing the 38.2% or 61.8% level"""
+    level382, level618 = fib_levels(high, low, period)
+    up382, down382 = _strict_crosses(close, level382)
+    up618, down618 = _strict_crosses(close, level618)
+    return up382 | up618, down382 | down618
+
+
+def bb_signals(close: np.ndarray, period: int, devfactor: float) -> Masks:
+    """Buy/sell masks for BollingerBandsStrategy: close touching the lower/upper band"""
+    _, top, bot = bollinger_bands(close, period, devfactor)
+    return close <= bot, close >= top